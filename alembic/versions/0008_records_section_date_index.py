@@ -0,0 +1,34 @@
+"""Index license_records on (section_type, record_date, id) for section searches.
+
+Section-filtered searches (the dashboard's section links) order by
+``record_date DESC, id DESC`` and take one page.  With only a single-column
+``section_type`` index PostgreSQL fetches every row of the section and
+sorts it; the composite index is walked backwards in result order and the
+scan stops after the page.  It also serves plain ``section_type`` lookups,
+so it replaces ``idx_records_section``.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_records_section_date",
+        "license_records",
+        ["section_type", "record_date", "id"],
+    )
+    op.drop_index("idx_records_section", table_name="license_records")
+
+
+def downgrade() -> None:
+    op.create_index("idx_records_section", "license_records", ["section_type"])
+    op.drop_index("idx_records_section_date", table_name="license_records")
@@ -0,0 +1,32 @@
+r"""Index locations on the folded address key used to reuse stored results.
+
+``backfill_addresses`` looks up locations whose raw address differs from a
+batch address only in case or spacing, so a twin's fresh result can be
+copied without an API call.  The lookup filters on
+``upper(regexp_replace(btrim(raw_address), '\s+', ' ', 'g'))``; without a
+matching expression index every chunk of every backfill page scans the
+whole table.  The expression must stay identical to
+``address_validator._address_key_sql``.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX idx_locations_address_key ON locations "
+        r"(upper(regexp_replace(btrim(raw_address), '\s+', ' ', 'g')))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_locations_address_key", table_name="locations")
@@ -11,6 +11,7 @@ Split from address_validator.py (#141).
 import asyncio
 import logging
 import os
+import time
 
 import httpx
 
@@ -32,15 +33,59 @@ DEFAULT_RETRY_AFTER = 2.0
 MAX_RETRY_AFTER = 60.0
 MAX_RETRIES = 3
 
-# Shared connection pool for all address validation HTTP calls.
-# httpx.AsyncClient binds to the event loop lazily (on first request), so
-# module-level construction is safe before any event loop exists.
-_shared_client: httpx.AsyncClient = httpx.AsyncClient(timeout=TIMEOUT)
+# Pool sizing for the shared client. Batch runs keep only a few calls in
+# flight (address_validator.BATCH_CONCURRENCY), so a handful of warm
+# connections does the work; the keep-alive expiry outlasts the longest
+# default inter-request spacing so each TCP+TLS session is reused across the
+# whole batch instead of re-handshaking.
+POOL_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=30.0,
+)
+
+# Shared connection pool for all address validation HTTP calls. Created
+# lazily and re-created after close: an AsyncClient's pooled connections are
+# bound to the event loop that opened them, and every CLI command runs its
+# own asyncio.run() loop.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the module-level httpx client, creating it on first use."""
+    global _shared_client  # noqa: PLW0603
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(timeout=TIMEOUT, limits=POOL_LIMITS)
+    return _shared_client
 
 
 async def close_shared_client() -> None:
-    """Close the module-level httpx client, releasing TLS sessions cleanly."""
-    await _shared_client.aclose()
+    """Close the module-level httpx client, releasing TLS sessions cleanly.
+
+    Safe to call when no client was ever created; the next
+    :func:`get_shared_client` call opens a fresh pool.
+    """
+    global _shared_client  # noqa: PLW0603
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+# Monotonic deadline until which the service has asked us to back off. Set by
+# _post_with_retry on 429/500 and read by batch rate limiting, so one
+# throttled call pauses every concurrent caller rather than only itself.
+_throttled_until = 0.0
+
+
+def throttle_remaining() -> float:
+    """Return seconds left on the shared service back-off (0.0 when clear)."""
+    return max(0.0, _throttled_until - time.monotonic())
+
+
+def _note_throttle(wait: float) -> None:
+    """Extend the shared back-off to at least *wait* seconds from now."""
+    global _throttled_until  # noqa: PLW0603
+    _throttled_until = max(_throttled_until, time.monotonic() + wait)
 
 
 def get_api_key() -> str:
@@ -98,9 +143,10 @@ async def _post_with_retry(
 
     Retries up to MAX_RETRIES times.  On 429, reads Retry-After header and
     sleeps that duration (doubling on each subsequent retry).  On 500, falls
-    back to DEFAULT_RETRY_AFTER with the same exponential backoff.  Returns the
-    final successful Response, or None if all retries exhausted or a
-    non-retryable error occurs.
+    back to DEFAULT_RETRY_AFTER with the same exponential backoff.  Each wait
+    is also published via :func:`throttle_remaining` for concurrent callers.
+    Returns the final successful Response, or None if all retries exhausted
+    or a non-retryable error occurs.
     """
     backoff_multiplier = 1.0
     for attempt in range(1, MAX_RETRIES + 1):
@@ -137,6 +183,7 @@ async def _post_with_retry(
                     MAX_RETRIES,
                     wait,
                 )
+            _note_throttle(wait)
             await asyncio.sleep(wait)
             backoff_multiplier *= 2.0
             continue
@@ -162,7 +209,7 @@ async def _call_endpoint(
     headers = {"X-API-Key": api_key}
     payload = {"address": address}
 
-    _client = client if client is not None else _shared_client
+    _client = client if client is not None else get_shared_client()
     response = await _post_with_retry(url, payload, headers, _client, label)
     if response is None:
         return None
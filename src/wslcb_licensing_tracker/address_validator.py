@@ -18,10 +18,20 @@ periodic commits) because it is a long-running bulk operation.
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 
 import httpx
-from sqlalchemy import func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    func,
+    literal_column,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from .address_client import (
@@ -29,6 +39,7 @@ from .address_client import (
     get_api_key,
     is_validation_enabled,
     standardize,
+    throttle_remaining,
     validate,
 )
 from .models import license_records, locations
@@ -49,16 +60,138 @@ VALIDATION_TTL_DAYS = 180
 # Upper bound on /validate calls per UTC day across all automatic backfill runs
 # (both twice-daily post-scrape hooks and the weekly timer share it). Kept well
 # under the upstream USPS 10K/day cap so we never 429 into the Google fallback
-# (160/day). attempted_at is stamped on every call, so counting rows with
-# attempted_at >= start-of-day is an exact same-day call count. #150.
+# (160/day). The ceiling counts rows with attempted_at >= start-of-day. Every
+# location a run processes is stamped, including case/spacing twins that share
+# one call and rows filled from a stored result with no call at all (see
+# _validate_batch), so the count is of rows attempted — a conservative upper
+# bound on same-day calls, never an undercount. #150.
 DAILY_VALIDATION_LIMIT = 5000
 
+# Maximum number of address API calls in flight during a batch run. Each call
+# is latency-bound, so overlapping a few of them hides round-trip time while
+# the per-call rate_limit spacing still bounds the request rate. Kept below
+# the shared client's keep-alive pool size so every call reuses a warm
+# connection.
+BATCH_CONCURRENCY = 4
+
+# Rows per keyset page for the unbounded selectors (refresh, and the
+# standardize-only backfill). Bounds memory to one page of (id, raw_address)
+# pairs and lets the first API call go out without reading the whole table.
+LOCATION_PAGE_SIZE = 2000
+
 
 def _sanitize_country(raw: str) -> str:
     """Return raw if it looks like an ISO 3166-1 alpha-2 code, else empty string."""
     return raw if (len(raw) == ISO_ALPHA2_LEN and raw.isalpha() and raw.isascii()) else ""
 
 
+# API payload key -> locations column for the std_* overlay both endpoints share.
+_STD_COLUMNS = {
+    "address_line_1": "std_address_line_1",
+    "address_line_2": "std_address_line_2",
+    "city": "std_city",
+    "region": "std_region",
+    "postal_code": "std_postal_code",
+}
+# Missing keys default to "" in one dict merge; a key the API sends as null
+# stays None (std_address_line_2 is nullable — see models.py).
+_STD_DEFAULTS = dict.fromkeys((*_STD_COLUMNS, "country"), "")
+
+
+def _std_values(result: dict) -> dict:
+    """Return the std_* column values (minus std_address_string) for an API payload."""
+    merged = _STD_DEFAULTS | result
+    values = {column: merged[key] for key, column in _STD_COLUMNS.items()}
+    values["std_country"] = _sanitize_country(merged["country"])
+    return values
+
+
+# Payload key carrying a donor row's provenance timestamps on a result copied
+# by _load_reusable_results; API payloads never contain it. The copied row keeps
+# the donor's standardized/validated stamps instead of claiming a fresh call.
+_DONOR_STAMPS = "_donor_stamps"
+
+
+def _standardized_values(result: dict, now: datetime | None = None) -> dict:
+    """Return the locations column values for a /standardize payload.
+
+    *now* stamps address_standardized_at; bulk writers pass one shared value.
+    """
+    return {
+        **_std_values(result),
+        "std_address_string": result.get("standardized"),
+        "validation_status": "standardized",
+        "address_standardized_at": now or datetime.now(UTC),
+        **result.get(_DONOR_STAMPS, {}),
+    }
+
+
+def _validated_values(result: dict, now: datetime | None = None) -> tuple[dict, bool]:
+    """Return the locations column values for a /validate payload.
+
+    Confirmed/corrected results overlay std_* and stamp all three timestamps.
+    Anything else records status, dpv and attempted_at only — std_* and
+    address_validated_at are left intact (non-destructive re-check; #150).
+    *now* is the timestamp to stamp; bulk writers pass one shared value. A
+    result copied from another row keeps that row's standardized/validated
+    stamps, so only attempted_at is *now*.
+
+    Returns:
+        ``(values, confirmed)`` — *confirmed* is True for a confirmed/corrected result.
+    """
+    validation = result.get("validation") or {}
+    status = validation.get("status", "")
+    dpv = validation.get("dpv_match_code")
+    now = now or datetime.now(UTC)
+
+    # Gate on validation status: v2 returns address_line_1="" (not None) for unconfirmed.
+    if status in CONFIRMED_STATUSES:
+        return {
+            **_std_values(result),
+            "std_address_string": result.get("validated"),
+            "validation_status": status,
+            "dpv_match_code": dpv,
+            "latitude": result.get("latitude"),
+            "longitude": result.get("longitude"),
+            "address_standardized_at": now,
+            "address_validated_at": now,
+            "address_validation_attempted_at": now,
+            **result.get(_DONOR_STAMPS, {}),
+        }, True
+
+    return {
+        "validation_status": status,
+        "dpv_match_code": dpv,
+        "address_validation_attempted_at": now,
+    }, False
+
+
+# One UPDATE for every location write, single-row and bulk. With no .values(),
+# SQLAlchemy derives the SET clause from the parameter keys, so each column
+# shape (standardized, confirmed, status-only) compiles once into the compiled
+# cache and maps onto one asyncpg prepared statement per connection — no
+# per-call statement construction.
+_UPDATE_LOCATION = update(locations).where(locations.c.id == bindparam("location_id"))
+
+
+async def _write_standardized(conn: AsyncConnection, location_id: int, result: dict) -> None:
+    """Overlay a /standardize payload onto a location row."""
+    await conn.execute(
+        _UPDATE_LOCATION, {"location_id": location_id, **_standardized_values(result)}
+    )
+
+
+async def _write_validated(conn: AsyncConnection, location_id: int, result: dict) -> bool:
+    """Write a /validate payload onto a location row (see :func:`_validated_values`).
+
+    Returns:
+        True if the result was confirmed/corrected, False otherwise.
+    """
+    values, confirmed = _validated_values(result)
+    await conn.execute(_UPDATE_LOCATION, {"location_id": location_id, **values})
+    return confirmed
+
+
 async def standardize_location(
     conn: AsyncConnection,
     location_id: int,
@@ -98,21 +231,7 @@ async def standardize_location(
         return False
 
     try:
-        await conn.execute(
-            update(locations)
-            .where(locations.c.id == location_id)
-            .values(
-                std_address_line_1=result.get("address_line_1", ""),
-                std_address_line_2=result.get("address_line_2", ""),
-                std_city=result.get("city", ""),
-                std_region=result.get("region", ""),
-                std_postal_code=result.get("postal_code", ""),
-                std_country=_sanitize_country(result.get("country", "")),
-                std_address_string=result.get("standardized"),
-                validation_status="standardized",
-                address_standardized_at=datetime.now(UTC),
-            )
-        )
+        await _write_standardized(conn, location_id, result)
     except Exception:
         logger.exception("Failed to update location %d", location_id)
         return False
@@ -164,53 +283,107 @@ async def validate_location(
     if result is None:
         return False
 
-    validation = result.get("validation") or {}
-    status = validation.get("status", "")
-    dpv = validation.get("dpv_match_code")
+    try:
+        return await _write_validated(conn, location_id, result)
+    except Exception:
+        logger.exception("Failed to update location %d during validate", location_id)
+        return False
 
-    # Gate on validation status: v2 returns address_line_1="" (not None) for unconfirmed.
-    has_address = status in CONFIRMED_STATUSES
-    now = datetime.now(UTC)
 
-    try:
-        if has_address:
-            await conn.execute(
-                update(locations)
-                .where(locations.c.id == location_id)
-                .values(
-                    std_address_line_1=result.get("address_line_1", ""),
-                    std_address_line_2=result.get("address_line_2", ""),
-                    std_city=result.get("city", ""),
-                    std_region=result.get("region", ""),
-                    std_postal_code=result.get("postal_code", ""),
-                    std_country=_sanitize_country(result.get("country", "")),
-                    std_address_string=result.get("validated"),
-                    validation_status=status,
-                    dpv_match_code=dpv,
-                    latitude=result.get("latitude"),
-                    longitude=result.get("longitude"),
-                    address_standardized_at=now,
-                    address_validated_at=now,
-                    address_validation_attempted_at=now,
-                )
-            )
-            return True
+async def _fetch_location_result(
+    location_id: int,
+    raw_address: str,
+    client: httpx.AsyncClient | None = None,
+) -> tuple[bool, dict] | None:
+    """Call the endpoint :func:`process_location` uses for the current config.
 
-        # not_confirmed or unavailable — record the attempt and status, but leave
-        # std_* and address_validated_at intact (non-destructive; #150).
-        await conn.execute(
-            update(locations)
-            .where(locations.c.id == location_id)
-            .values(
-                validation_status=status,
-                dpv_match_code=dpv,
-                address_validation_attempted_at=now,
-            )
+    Makes no DB calls, so batch runs can issue several concurrently and apply
+    the results afterwards with :func:`_apply_location_result`.
+
+    Returns:
+        ``(validated, payload)`` — *validated* is True for a /validate payload
+        and False for a /standardize one — or None on empty input or API failure.
+    """
+    if not raw_address or not raw_address.strip():
+        return None
+
+    validated = is_validation_enabled()
+    try:
+        if validated:
+            # Single /validate call covers both standardization and validation.
+            result = await validate(raw_address, client)
+        else:
+            result = await standardize(raw_address, client)
+    except Exception:
+        logger.exception(
+            "%s failed for location %d", "Validate" if validated else "Standardize", location_id
         )
+        return None
+
+    if result is None:
+        return None
+    return validated, result
+
+
+async def _apply_location_result(
+    conn: AsyncConnection,
+    location_id: int,
+    fetched: tuple[bool, dict],
+) -> bool:
+    """Write a result from :func:`_fetch_location_result` to a location row.
+
+    Does NOT commit — the caller is responsible for committing.
+
+    Returns True if the location was successfully processed, False otherwise.
+    """
+    validated, result = fetched
+    try:
+        if validated:
+            return await _write_validated(conn, location_id, result)
+        await _write_standardized(conn, location_id, result)
     except Exception:
-        logger.exception("Failed to update location %d during validate", location_id)
+        logger.exception("Failed to update location %d during process", location_id)
+        return False
+    return True
+
+
+async def _apply_location_results(
+    conn: AsyncConnection,
+    writes: list[tuple[int, tuple[bool, dict]]],
+) -> int:
+    """Write many :func:`_fetch_location_result` results in bulk.
 
-    return False
+    Rows are grouped by the set of columns they update (standardized,
+    confirmed, or status-only) and each group is sent as a single
+    executemany UPDATE, so a chunk costs at most three round-trips instead
+    of one per row.
+
+    Does NOT commit — the caller is responsible for committing.
+
+    Args:
+        conn: Async SQLAlchemy connection.
+        writes: ``(location_id, fetched)`` pairs.
+
+    Returns:
+        Number of locations successfully processed — the count of rows for
+        which :func:`_apply_location_result` would have returned True.
+    """
+    # One timestamp per call: the whole chunk was fetched together, and
+    # second-level skew between its rows carries no meaning.
+    now = datetime.now(UTC)
+    by_shape: dict[tuple[str, ...], list[dict]] = {}
+    succeeded = 0
+    for location_id, (validated, result) in writes:
+        if validated:
+            values, ok = _validated_values(result, now)
+        else:
+            values, ok = _standardized_values(result, now), True
+        succeeded += ok
+        by_shape.setdefault(tuple(values), []).append({"location_id": location_id, **values})
+
+    for params in by_shape.values():
+        await conn.execute(_UPDATE_LOCATION, params)
+    return succeeded
 
 
 async def process_location(
@@ -233,69 +406,10 @@ async def process_location(
 
     Returns True if the location was successfully processed, False otherwise.
     """
-    if not raw_address or not raw_address.strip():
-        return False
-
-    if is_validation_enabled():
-        # Single /validate call covers both standardization and validation.
-        try:
-            result = await validate(raw_address, client)
-        except Exception:
-            logger.exception("Validate failed for location %d", location_id)
-            return False
-
-        if result is None:
-            return False
-
-        validation = result.get("validation") or {}
-        status = validation.get("status", "")
-        dpv = validation.get("dpv_match_code")
-        # Gate on validation status: v2 returns address_line_1="" (not None) for unconfirmed.
-        has_address = status in CONFIRMED_STATUSES
-        now = datetime.now(UTC)
-
-        try:
-            if has_address:
-                await conn.execute(
-                    update(locations)
-                    .where(locations.c.id == location_id)
-                    .values(
-                        std_address_line_1=result.get("address_line_1", ""),
-                        std_address_line_2=result.get("address_line_2", ""),
-                        std_city=result.get("city", ""),
-                        std_region=result.get("region", ""),
-                        std_postal_code=result.get("postal_code", ""),
-                        std_country=_sanitize_country(result.get("country", "")),
-                        std_address_string=result.get("validated"),
-                        validation_status=status,
-                        dpv_match_code=dpv,
-                        latitude=result.get("latitude"),
-                        longitude=result.get("longitude"),
-                        address_standardized_at=now,
-                        address_validated_at=now,
-                        address_validation_attempted_at=now,
-                    )
-                )
-                return True
-
-            # not_confirmed or unavailable — record the attempt and status, but leave
-            # std_* and address_validated_at intact (non-destructive; #150).
-            await conn.execute(
-                update(locations)
-                .where(locations.c.id == location_id)
-                .values(
-                    validation_status=status,
-                    dpv_match_code=dpv,
-                    address_validation_attempted_at=now,
-                )
-            )
-        except Exception:
-            logger.exception("Failed to update location %d during process", location_id)
-
+    fetched = await _fetch_location_result(location_id, raw_address, client)
+    if fetched is None:
         return False
-
-    # Validation disabled — standardize only.
-    return await standardize_location(conn, location_id, raw_address, client)
+    return await _apply_location_result(conn, location_id, fetched)
 
 
 async def _validate_record_location(
@@ -306,20 +420,14 @@ async def _validate_record_location(
 ) -> bool:
     """Standardize (and optionally validate) a location FK on a license record.
 
-    Looks up *fk_column* ('location_id' or 'previous_location_id') on the
-    record and processes the referenced location row.
+    Resolves *fk_column* ('location_id' or 'previous_location_id') and the
+    referenced location row in one joined query, then processes the location.
 
     Skips if the location is already fully processed for the current config.
 
     Returns True if the location was already processed or standardization succeeded.
     """
     col = getattr(license_records.c, fk_column)
-    row = (
-        await conn.execute(select(col).where(license_records.c.id == record_id))
-    ).scalar_one_or_none()
-    if not row:
-        return False
-
     loc_row = (
         (
             await conn.execute(
@@ -328,7 +436,9 @@ async def _validate_record_location(
                     locations.c.raw_address,
                     locations.c.address_standardized_at,
                     locations.c.address_validated_at,
-                ).where(locations.c.id == row)
+                )
+                .select_from(license_records.join(locations, locations.c.id == col))
+                .where(license_records.c.id == record_id)
             )
         )
         .mappings()
@@ -363,40 +473,159 @@ async def validate_previous_location(
     return await _validate_record_location(conn, record_id, "previous_location_id", client)
 
 
-async def _validate_batch(
-    conn: AsyncConnection,
-    rows: list,
-    label: str,
-    batch_size: int = 100,
-    rate_limit: float = 0.5,
-) -> int:
-    """Standardize (and optionally validate) a list of location rows.
+def _address_key(raw_address: str) -> str:
+    """Return the batch dedup key for *raw_address*: case-folded, whitespace-collapsed."""
+    return " ".join(raw_address.split()).upper()
 
-    Each row must have 'id' and 'raw_address' keys (mappings).
 
-    Uses :func:`process_location` for a single API call per row.
-    Wraps each row in a savepoint so a single DB failure does not poison the
-    batch.  Commits every *batch_size* rows to flush progress incrementally.
+def _address_key_sql() -> ColumnElement[str]:
+    """SQL counterpart of :func:`_address_key` over ``locations.raw_address``.
+
+    Must stay textually identical to ``idx_locations_address_key`` (Alembic
+    0009) for the planner to use the index, so the pattern arguments are
+    inlined as literals rather than sent as bind parameters.
+    """
+    return func.upper(
+        func.regexp_replace(
+            func.btrim(locations.c.raw_address),
+            literal_column(r"'\s+'"),
+            literal_column("' '"),
+            literal_column("'g'"),
+        )
+    )
+
+
+async def _load_reusable_results(
+    conn: AsyncConnection,
+    keys: list[str],
+) -> dict[str, tuple[bool, dict]]:
+    """Return stored API results for *keys* from locations processed within the TTL.
+
+    The locations table doubles as the persistent response cache: a location
+    whose address differs from an already-processed one only in case or
+    spacing reuses that row's std_* columns instead of calling the API again.
+    Only results the current mode would write are reused — confirmed
+    validations when validation is enabled, any standardization otherwise —
+    and only while fresher than VALIDATION_TTL_DAYS, so renewal still reaches
+    the service. The key lookup is served by the ``idx_locations_address_key``
+    expression index.
+
+    The copied payload carries the donor's own standardized/validated
+    timestamps (under ``_DONOR_STAMPS``), so a copy ages with its donor and
+    twins cannot keep refreshing each other past the TTL. When several rows
+    share a key, the most recently processed one is the donor.
 
     Returns:
-        Number of locations successfully processed.
+        Mapping of dedup key to a ``(validated, payload)`` pair shaped like the
+        return value of :func:`_fetch_location_result`.
+    """
+    if not keys:
+        return {}
+
+    validated = is_validation_enabled()
+    cutoff = datetime.now(UTC) - timedelta(days=VALIDATION_TTL_DAYS)
+    key_expr = _address_key_sql()
+    stamp_col = (
+        locations.c.address_validated_at if validated else locations.c.address_standardized_at
+    )
+    stmt = select(
+        key_expr.label("key"),
+        locations.c.address_standardized_at,
+        locations.c.address_validated_at,
+        locations.c.std_address_line_1,
+        locations.c.std_address_line_2,
+        locations.c.std_city,
+        locations.c.std_region,
+        locations.c.std_postal_code,
+        locations.c.std_country,
+        locations.c.std_address_string,
+        locations.c.validation_status,
+        locations.c.dpv_match_code,
+        locations.c.latitude,
+        locations.c.longitude,
+    ).where(key_expr.in_(keys), stamp_col >= cutoff)
+    if validated:
+        stmt = stmt.where(locations.c.validation_status.in_(CONFIRMED_STATUSES))
+    # Freshest donor first; the first row per key wins below.
+    stmt = stmt.order_by(stamp_col.desc(), locations.c.id)
+
+    reusable: dict[str, tuple[bool, dict]] = {}
+    for row in (await conn.execute(stmt)).mappings():
+        if row["key"] in reusable:
+            continue
+        payload = {
+            "address_line_1": row["std_address_line_1"],
+            "address_line_2": row["std_address_line_2"],
+            "city": row["std_city"],
+            "region": row["std_region"],
+            "postal_code": row["std_postal_code"],
+            "country": row["std_country"],
+        }
+        if validated:
+            payload["validated"] = row["std_address_string"]
+            payload["validation"] = {
+                "status": row["validation_status"],
+                "dpv_match_code": row["dpv_match_code"],
+            }
+            payload["latitude"] = row["latitude"]
+            payload["longitude"] = row["longitude"]
+            payload[_DONOR_STAMPS] = {
+                "address_standardized_at": row["address_standardized_at"],
+                "address_validated_at": row["address_validated_at"],
+            }
+        else:
+            payload["standardized"] = row["std_address_string"]
+            payload[_DONOR_STAMPS] = {"address_standardized_at": row["address_standardized_at"]}
+        reusable[row["key"]] = (validated, payload)
+    return reusable
+
+
+class _RateLimiter:
+    """Space request starts at least *interval* seconds apart across concurrent tasks.
+
+    Each caller reserves the next free start slot before sleeping, so the
+    spacing holds globally however many workers are in flight. Slots are also
+    pushed past any back-off the service has signalled with a 429/500
+    (:func:`~.address_client.throttle_remaining`), so a throttle seen by one
+    worker pauses them all instead of letting the others keep hitting the
+    service until they are throttled too.
     """
-    total = len(rows)
-    if total == 0:
-        logger.info("No locations to %s", label.lower())
-        return 0
 
-    logger.info("%s for %d locations", label, total)
-    succeeded = 0
-    errors = 0
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until this caller's start slot comes up."""
+        backoff = throttle_remaining()
+        if self._interval <= 0 and not backoff:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now + backoff, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 
-    for attempted, row in enumerate(rows, start=1):
-        location_id = row["id"]
-        address = row["raw_address"]
+async def _apply_rows_individually(
+    conn: AsyncConnection,
+    writes: list[tuple[int, tuple[bool, dict]]],
+) -> tuple[int, int, bool]:
+    """Write results one row at a time, each in its own savepoint.
+
+    Fallback for when a bulk write fails: isolates the offending row so the
+    rest of the chunk still lands.
 
+    Returns:
+        ``(succeeded, errors, aborted)`` — *aborted* is True when the outer
+        transaction could not be recovered and the batch must stop.
+    """
+    succeeded = 0
+    errors = 0
+    for location_id, fetched in writes:
         try:
             async with conn.begin_nested():
-                ok = await process_location(conn, location_id, address)
+                ok = await _apply_location_result(conn, location_id, fetched)
             if ok:
                 succeeded += 1
         except Exception as exc:  # noqa: BLE001 — intentionally broad; savepoint isolates damage
@@ -404,7 +633,7 @@ async def _validate_batch(
             errors += 1
             # If the outer transaction entered an aborted state (e.g. InFailedSQLTransactionError),
             # begin_nested() itself will fail on every subsequent row.  Rollback to recover a clean
-            # transaction before continuing; break if the rollback also fails.
+            # transaction before continuing; stop if the rollback also fails.
             orig = getattr(exc, "orig", exc.__cause__)
             if orig is not None and "InFailedSQLTransaction" in str(orig):
                 logger.warning("Outer transaction aborted; rolling back to recover")
@@ -412,18 +641,201 @@ async def _validate_batch(
                     await conn.rollback()
                 except Exception:
                     logger.exception("Rollback failed; aborting batch")
-                    break
+                    return succeeded, errors, True
+    return succeeded, errors, False
+
+
+async def _relax_commit_durability(conn: AsyncConnection) -> None:
+    """Skip the WAL flush wait on commit for the current transaction.
+
+    Batch progress is re-derivable: a chunk lost to a server crash just leaves
+    its locations unprocessed, and the next backfill selects them again. So
+    each chunk commit can return without waiting for the WAL fsync. SET LOCAL
+    ends with the transaction and never leaks onto the pooled connection, and
+    unlike fsync=off it cannot corrupt data.
+    """
+    await conn.execute(text("SET LOCAL synchronous_commit = off"))
+
+
+async def _validate_batch(  # noqa: PLR0913
+    conn: AsyncConnection,
+    rows: list,
+    label: str,
+    batch_size: int = 100,
+    rate_limit: float = 0.5,
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    reuse_stored: bool = False,
+) -> int:
+    """Standardize (and optionally validate) a list of location rows.
+
+    See :func:`_run_batch`, which does the work and also reports whether the
+    batch had to abort.
+
+    Returns:
+        Number of locations successfully processed.
+    """
+    succeeded, _ = await _run_batch(
+        conn,
+        rows,
+        label,
+        batch_size,
+        rate_limit,
+        concurrency=concurrency,
+        reuse_stored=reuse_stored,
+    )
+    return succeeded
+
+
+async def _run_batch(  # noqa: PLR0913
+    conn: AsyncConnection,
+    rows: list,
+    label: str,
+    batch_size: int,
+    rate_limit: float,
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    reuse_stored: bool = False,
+) -> tuple[int, bool]:
+    """Standardize (and optionally validate) a list of location rows.
 
-        if attempted % batch_size == 0:
-            await conn.commit()
-            logger.info("Progress: %d/%d (%d ok, %d err)", attempted, total, succeeded, errors)
+    Each row must have 'id' and 'raw_address' keys (mappings).
+
+    Rows are grouped by :func:`_address_key` so each distinct address is sent
+    to the API once, and the result is written to every location in the group.
+    Groups are handled in chunks of *batch_size*. For each chunk the API calls
+    run concurrently — at most *concurrency* in flight, starts spaced
+    *rate_limit* seconds apart — then the results are written on *conn* in
+    bulk (:func:`_apply_location_results`) inside a savepoint. If the bulk
+    write fails the chunk is retried row by row, each row in its own
+    savepoint, so a single DB failure does not poison the batch. Every chunk
+    is committed to flush progress incrementally. Every location in a group
+    is stamped as attempted, so the daily budget in :func:`backfill_addresses`
+    counts each of them even though the group cost one call.
+
+    With *reuse_stored*, addresses that already have a fresh result on another
+    location row (see :func:`_load_reusable_results`) skip the API call. Those
+    rows are still stamped as attempted — they are scheduled like any other
+    row — and so count against the daily budget too.
+
+    Returns:
+        ``(succeeded, aborted)`` — *aborted* is True when the outer transaction
+        could not be recovered after a failed write, leaving *conn* unusable.
+    """
+    total = len(rows)
+    if total == 0:
+        logger.info("No locations to %s", label.lower())
+        return 0, False
 
-        if rate_limit:
-            await asyncio.sleep(rate_limit)
+    groups: dict[str, list[Mapping]] = {}
+    for row in rows:
+        groups.setdefault(_address_key(row["raw_address"]), []).append(row)
+    distinct = list(groups.items())
+
+    logger.info("%s for %d locations (%d distinct addresses)", label, total, len(distinct))
+    succeeded = 0
+    errors = 0
+    done = 0
+    aborted = False
+    limiter = _RateLimiter(rate_limit)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(group: list[Mapping]) -> tuple[bool, dict] | None:
+        async with semaphore:
+            await limiter.wait()
+            return await _fetch_location_result(group[0]["id"], group[0]["raw_address"])
+
+    for start in range(0, len(distinct), batch_size):
+        chunk = distinct[start : start + batch_size]
+        results = await _load_reusable_results(conn, [k for k, _ in chunk]) if reuse_stored else {}
+        to_fetch = [(key, group) for key, group in chunk if key not in results]
+        fetched_now = await asyncio.gather(*(_fetch(group) for _, group in to_fetch))
+        results.update(zip((key for key, _ in to_fetch), fetched_now, strict=True))
+        done += sum(len(group) for _, group in chunk)
+
+        writes = [
+            (row["id"], results[key])
+            for key, group in chunk
+            if results[key] is not None
+            for row in group
+        ]
+        if writes:
+            await _relax_commit_durability(conn)
+            try:
+                async with conn.begin_nested():
+                    succeeded += await _apply_location_results(conn, writes)
+            except Exception:  # broad on purpose; fall back to row-by-row
+                logger.warning(
+                    "Bulk write failed for %d locations; retrying row by row",
+                    len(writes),
+                    exc_info=True,
+                )
+                ok, failed, aborted = await _apply_rows_individually(conn, writes)
+                succeeded += ok
+                errors += failed
+                if aborted:
+                    break
+
+        await conn.commit()
+        logger.info("Progress: %d/%d (%d ok, %d err)", done, total, succeeded, errors)
 
-    # Final commit for any remaining rows after the last batch_size boundary.
-    await conn.commit()
     logger.info("Done: %d/%d succeeded (%d failed)", succeeded, total, total - succeeded)
+    return succeeded, aborted
+
+
+async def _validate_pages(  # noqa: PLR0913
+    conn: AsyncConnection,
+    stmt: Select,
+    label: str,
+    batch_size: int,
+    rate_limit: float,
+    *,
+    reuse_stored: bool = False,
+) -> int:
+    """Run :func:`_validate_batch` over *stmt* one keyset page at a time.
+
+    *stmt* must select ``locations.c.id`` and ``raw_address`` with no ORDER BY
+    or LIMIT. Each page is a fresh ``id > last_id`` query issued after the
+    previous page has committed, so no server-side cursor has to survive
+    _validate_batch's per-chunk commits. A page whose batch aborts stops the
+    walk: its connection is no longer usable for the next page query.
+
+    Returns:
+        Number of locations successfully processed across all pages.
+    """
+    succeeded = 0
+    last_id = 0
+    while True:
+        page = (
+            (
+                await conn.execute(
+                    stmt.where(locations.c.id > last_id)
+                    .order_by(locations.c.id)
+                    .limit(LOCATION_PAGE_SIZE)
+                )
+            )
+            .mappings()
+            .all()
+        )
+        if not page:
+            if not last_id:
+                logger.info("No locations to %s", label.lower())
+            break
+        page_succeeded, aborted = await _run_batch(
+            conn,
+            page,
+            label,
+            batch_size,
+            rate_limit,
+            reuse_stored=reuse_stored,
+        )
+        succeeded += page_succeeded
+        if aborted:
+            logger.error("%s aborted after id %d; skipping remaining pages", label, last_id)
+            break
+        last_id = page[-1]["id"]
+        if len(page) < LOCATION_PAGE_SIZE:
+            break
     return succeeded
 
 
@@ -447,9 +859,16 @@ async def backfill_addresses(
       mode so it cannot be the scheduling key.
 
     The daily ceiling (validation-enabled path only) bounds /validate calls per
-    UTC day across all automatic runs to stay within upstream limits. attempted_at
-    is stamped on every call, so counting rows attempted since start-of-day is an
-    exact same-day call count shared with any manual refresh run.
+    UTC day across all automatic runs to stay within upstream limits. It counts
+    rows attempted since start-of-day, shared with any manual refresh run; rows
+    that shared a call with a case/spacing twin, or were filled from a stored
+    result, are each counted, so the count is an upper bound on calls made and
+    the ceiling errs on the side of fewer.
+
+    Addresses with a fresh result already stored on another location row are
+    filled from that row without an API call (see :func:`_load_reusable_results`).
+    Manual refreshes never reuse stored results — re-asking the service is
+    their purpose.
 
     Returns:
         Number of locations successfully standardized.
@@ -464,36 +883,44 @@ async def backfill_addresses(
 
     if not is_validation_enabled():
         # Standardize-only: attempted_at is never set here, so key on std_at.
-        stmt = base.where(locations.c.address_standardized_at.is_(None))
-    else:
-        now = datetime.now(UTC)
-        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        used_today = (
-            await conn.execute(
-                select(func.count())
-                .select_from(locations)
-                .where(locations.c.address_validation_attempted_at >= day_start)
-            )
-        ).scalar_one()
-        budget = max(0, daily_limit - used_today)
-        if budget == 0:
-            logger.info(
-                "Daily validation limit reached (%d used of %d); skipping backfill",
-                used_today,
-                daily_limit,
-            )
-            return 0
+        # Unbounded (no daily budget), so walk it in keyset pages.
+        return await _validate_pages(
+            conn,
+            base.where(locations.c.address_standardized_at.is_(None)),
+            "Backfilling addresses",
+            batch_size,
+            rate_limit,
+            reuse_stored=True,
+        )
 
-        ttl_cutoff = now - timedelta(days=VALIDATION_TTL_DAYS)
-        stmt = (
-            base.where(
-                (locations.c.address_validation_attempted_at.is_(None))
-                | (locations.c.address_validation_attempted_at < ttl_cutoff)
-            )
-            .order_by(locations.c.address_validation_attempted_at.asc().nulls_first())
-            .limit(budget)
+    now = datetime.now(UTC)
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    used_today = (
+        await conn.execute(
+            select(func.count())
+            .select_from(locations)
+            .where(locations.c.address_validation_attempted_at >= day_start)
+        )
+    ).scalar_one()
+    budget = max(0, daily_limit - used_today)
+    if budget == 0:
+        logger.info(
+            "Daily validation limit reached (%d used of %d); skipping backfill",
+            used_today,
+            daily_limit,
         )
+        return 0
 
+    # Bounded by the daily budget, so a single fetch stays small.
+    ttl_cutoff = now - timedelta(days=VALIDATION_TTL_DAYS)
+    stmt = (
+        base.where(
+            (locations.c.address_validation_attempted_at.is_(None))
+            | (locations.c.address_validation_attempted_at < ttl_cutoff)
+        )
+        .order_by(locations.c.address_validation_attempted_at.asc().nulls_first())
+        .limit(budget)
+    )
     rows = (await conn.execute(stmt)).mappings().all()
 
     return await _validate_batch(
@@ -502,6 +929,7 @@ async def backfill_addresses(
         "Backfilling addresses",
         batch_size=batch_size,
         rate_limit=rate_limit,
+        reuse_stored=True,
     )
 
 
@@ -521,24 +949,14 @@ async def refresh_addresses(
         logger.error("No API key configured for address validation")
         return 0
 
-    rows = (
-        (
-            await conn.execute(
-                select(locations.c.id, locations.c.raw_address)
-                .where(locations.c.raw_address.isnot(None))
-                .where(locations.c.raw_address != "")
-            )
-        )
-        .mappings()
-        .all()
-    )
-
-    return await _validate_batch(
+    return await _validate_pages(
         conn,
-        rows,
+        select(locations.c.id, locations.c.raw_address)
+        .where(locations.c.raw_address.isnot(None))
+        .where(locations.c.raw_address != ""),
         "Refreshing addresses",
-        batch_size=batch_size,
-        rate_limit=rate_limit,
+        batch_size,
+        rate_limit,
     )
 
 
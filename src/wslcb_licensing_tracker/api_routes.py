@@ -10,13 +10,16 @@ The CSV export endpoint (/api/v1/export) is exempt from the envelope
 """
 
 import csv
+import hashlib
 import io
 import logging
+import operator
+import zlib
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -46,6 +49,42 @@ def _ok(data: object, message: str = "OK") -> JSONResponse:
     return JSONResponse({"ok": True, "message": message, "data": data})
 
 
+_HTTP_304 = 304
+_CACHE_CONTROL = "public, max-age=300"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header value matches *etag*.
+
+    Per RFC 9110 the header is ``*`` or a comma-separated list of entity
+    tags, compared weakly: a ``W/`` prefix (often added by proxies that
+    re-encode the body) is ignored on either side.
+    """
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _cacheable(request: Request, payload: dict) -> Response:
+    """Return *payload* as JSON with an ETag, or 304 when the client's copy matches.
+
+    The data is still read live from the database on every request (#99);
+    the ETag only saves re-sending an unchanged body once max-age expires.
+    """
+    resp = JSONResponse(payload, headers={"Cache-Control": _CACHE_CONTROL})
+    etag = f'"{hashlib.blake2b(resp.body, digest_size=16).hexdigest()}"'
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(
+            status_code=_HTTP_304,
+            headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL},
+        )
+    resp.headers["ETag"] = etag
+    return resp
+
+
 # ---------------------------------------------------------------------------
 # GET /api/v1/cities
 # ---------------------------------------------------------------------------
@@ -53,24 +92,20 @@ def _ok(data: object, message: str = "OK") -> JSONResponse:
 
 @router.get("/cities")
 async def api_cities(
+    request: Request,
     state: str = "",
     conn: Conn = ...,  # injected by FastAPI
-) -> JSONResponse:
+) -> Response:
     """Return cities for a given US state code.
 
     Used by the search form to populate the city dropdown dynamically.
-    Returns an empty list for unknown or missing state codes.
+    Returns an empty list for unknown or missing state codes.  Responses
+    carry an ETag so revalidation after max-age is a bodiless 304.
     """
     if not state or state not in US_STATES:
-        return JSONResponse(
-            {"ok": True, "message": "No cities for state", "data": []},
-            headers={"Cache-Control": "public, max-age=300"},
-        )
+        return _cacheable(request, {"ok": True, "message": "No cities for state", "data": []})
     cities = await get_cities_for_state(conn, state)
-    return JSONResponse(
-        {"ok": True, "message": f"Cities for {state}", "data": cities},
-        headers={"Cache-Control": "public, max-age=300"},
-    )
+    return _cacheable(request, {"ok": True, "message": f"Cities for {state}", "data": cities})
 
 
 # ---------------------------------------------------------------------------
@@ -166,6 +201,53 @@ _EXPORT_FIELDNAMES = [
     "days_to_outcome",
 ]
 
+# Pulls the CSV columns out of an export row in one C-level call.
+_export_values = operator.itemgetter(*_EXPORT_FIELDNAMES)
+
+# Rows serialized per yielded chunk: keeps memory flat while avoiding one
+# ASGI send per row on large exports.
+_EXPORT_CHUNK_ROWS = 500
+
+# Fastest gzip level: exports are bandwidth-bound and repetitive CSV still
+# shrinks several-fold at level 1.
+_EXPORT_GZIP_LEVEL = 1
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an Accept-Encoding header value allows a gzip response.
+
+    Parses the comma-separated codings and their q-values (RFC 9110): an
+    explicit ``gzip`` entry decides on its own, otherwise ``*`` does.
+    ``q=0`` — or a q-value that does not parse — means not acceptable.
+    """
+    wildcard = False
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if coding not in {"gzip", "*"}:
+            continue
+        q = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        if coding == "gzip":
+            return q > 0
+        wildcard = q > 0
+    return wildcard
+
+
+async def _gzip_stream(chunks: AsyncGenerator[str, None]) -> AsyncGenerator[bytes, None]:
+    """Gzip-encode a stream of text chunks incrementally."""
+    compressor = zlib.compressobj(_EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
 
 @router.get("/export")
 async def export_csv(  # noqa: PLR0913
@@ -183,8 +265,10 @@ async def export_csv(  # noqa: PLR0913
     """Stream search results as a CSV file.
 
     Accepts the same filter parameters as the search form.  Rows are
-    yielded directly from the PostgreSQL cursor to keep memory usage flat
-    regardless of result set size.
+    yielded directly from the PostgreSQL cursor in chunks of
+    ``_EXPORT_CHUNK_ROWS`` to keep memory usage flat regardless of result
+    set size; proxy buffering is disabled so the first bytes go out at once.
+    Clients sending ``Accept-Encoding: gzip`` receive a gzip-encoded body.
     """
     if not state:
         city = ""
@@ -192,9 +276,12 @@ async def export_csv(  # noqa: PLR0913
     async def _async_csv_generator() -> AsyncGenerator[str, None]:
         """Yield CSV rows incrementally from the database cursor."""
         buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=_EXPORT_FIELDNAMES, extrasaction="ignore")
-        writer.writeheader()
+        writer = csv.writer(buf)
+        writer.writerow(_EXPORT_FIELDNAMES)
         yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate(0)
+        rows: list[tuple] = []
 
         async with get_db(request.app.state.engine) as conn:
             async for record in export_records_cursor(
@@ -209,13 +296,24 @@ async def export_csv(  # noqa: PLR0913
                 date_to=date_to,
                 outcome_status=outcome_status,
             ):
-                buf.seek(0)
-                buf.truncate(0)
-                writer.writerow({k: record.get(k, "") or "" for k in _EXPORT_FIELDNAMES})
-                yield buf.getvalue()
-
-    return StreamingResponse(
-        _async_csv_generator(),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=wslcb_records.csv"},
-    )
+                rows.append(tuple(v or "" for v in _export_values(record)))
+                if len(rows) >= _EXPORT_CHUNK_ROWS:
+                    writer.writerows(rows)
+                    rows.clear()
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+        if rows:
+            writer.writerows(rows)
+            yield buf.getvalue()
+
+    headers = {
+        "Content-Disposition": "attachment; filename=wslcb_records.csv",
+        "X-Accel-Buffering": "no",
+        "Vary": "Accept-Encoding",
+    }
+    body: AsyncGenerator[str, None] | AsyncGenerator[bytes, None] = _async_csv_generator()
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_stream(body)
+    return StreamingResponse(body, media_type="text/csv", headers=headers)
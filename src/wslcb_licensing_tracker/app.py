@@ -29,10 +29,10 @@ from .admin_auth import AdminRedirectException, get_current_user
 from .config import get_build_id
 from .data_migration import run_pending_migrations
 from .db import DATA_DIR, get_record_sources
-from .display import format_outcome, summarize_provenance
+from .display import summarize_provenance
 from .engine import create_engine_from_env, get_db
 from .entities import get_entity_by_id
-from .link_records import get_outcome_status, get_reverse_link_info
+from .link_records import get_reverse_link_info
 from .log_config import setup_logging
 from .parser import (
     extract_tbody_from_diff,
@@ -45,9 +45,8 @@ from .queries_filter import get_cities_for_state, get_filter_options
 from .queries_hydrate import hydrate_records
 from .queries_search import (
     get_record_by_id,
-    get_record_link,
     get_record_source_link,
-    get_related_records,
+    get_record_with_related,
     get_source_by_id,
     search_records,
 )
@@ -98,7 +97,9 @@ app.include_router(admin_routes.router)
 app.include_router(admin_endorsement_routes.router)
 app.include_router(api_routes.router)
 templates = Jinja2Templates(directory="templates")
-
+# Templates only change on deploy, which restarts the service; skip the
+# per-render mtime check on every cached template.
+templates.env.auto_reload = False
 
 templates.env.globals["build_id"] = get_build_id()
 
@@ -233,6 +234,8 @@ async def search(  # noqa: PLR0913
     # City requires state context (names aren't unique across states).
     if not state:
         city = ""
+    # HTMX partials only re-render the result table, never the filter form.
+    is_partial = bool(request.headers.get("HX-Request"))
 
     async with get_db(request.app.state.engine) as conn:
         records, total = await search_records(
@@ -248,23 +251,33 @@ async def search(  # noqa: PLR0913
             outcome_status=outcome_status,
             page=page,
         )
-        filters = await get_filter_options(conn)
-        cities = await get_cities_for_state(conn, state) if state else []
+        if is_partial:
+            filters, cities = {}, []
+        else:
+            filters = await get_filter_options(conn)
+            cities = await get_cities_for_state(conn, state) if state else []
 
     total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
 
-    # Build export URL with multi-value endorsement params.
-    base_params = [
-        ("q", q),
-        ("section_type", section_type),
-        ("application_type", application_type),
-        ("state", state),
-        ("city", city),
-        ("date_from", date_from),
-        ("date_to", date_to),
-        ("outcome_status", outcome_status),
-    ]
-    export_params = urlencode(base_params + [("endorsement", e) for e in endorsement])
+    # Build export URL with multi-value endorsement params.  Empty filters are
+    # dropped: the export endpoint defaults every parameter to "".
+    export_params = urlencode(
+        [
+            (k, v)
+            for k, v in (
+                ("q", q),
+                ("section_type", section_type),
+                ("application_type", application_type),
+                ("state", state),
+                ("city", city),
+                ("date_from", date_from),
+                ("date_to", date_to),
+                ("outcome_status", outcome_status),
+                *(("endorsement", e) for e in endorsement),
+            )
+            if v
+        ]
+    )
 
     ctx = {
         "request": request,
@@ -283,10 +296,10 @@ async def search(  # noqa: PLR0913
         "date_from": date_from,
         "date_to": date_to,
         "outcome_status": outcome_status,
-        "export_url": f"/api/v1/export?{export_params}",
+        "export_url": f"/api/v1/export?{export_params}" if export_params else "/api/v1/export",
     }
 
-    if request.headers.get("HX-Request"):
+    if is_partial:
         return await _tpl(request, "partials/results.html", ctx)
 
     return await _tpl(request, "search.html", ctx)
@@ -296,7 +309,7 @@ async def search(  # noqa: PLR0913
 async def record_detail(request: Request, record_id: int) -> HTMLResponse:
     """Render the detail page for a single license record."""
     async with get_db(request.app.state.engine) as conn:
-        record = await get_record_by_id(conn, record_id)
+        record, related_rows = await get_record_with_related(conn, record_id)
         if not record:
             return await _tpl(
                 request,
@@ -305,9 +318,6 @@ async def record_detail(request: Request, record_id: int) -> HTMLResponse:
                 status_code=_HTTP_404,
             )
 
-        # API difference: queries_search.get_related_records takes (conn, record: dict)
-        related_rows = await get_related_records(conn, record)
-
         # Hydrate record + related in a single batch
         hydrated = await hydrate_records(conn, [record, *related_rows])
         record = hydrated[0]
@@ -316,8 +326,8 @@ async def record_detail(request: Request, record_id: int) -> HTMLResponse:
         sources = await get_record_sources(conn, record_id)
         provenance = summarize_provenance(sources)
 
-        link = await get_record_link(conn, record_id)
-        outcome = format_outcome(get_outcome_status(record, link))
+        # hydrate_records already resolved the best outcome link.
+        outcome = record["outcome_status"]
         reverse_link = await get_reverse_link_info(conn, record)
 
     return await _tpl(
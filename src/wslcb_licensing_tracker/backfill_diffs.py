@@ -8,14 +8,23 @@ parser produced, and recovers records the changed-only stream loses.
 
 Each record is stamped with the diff file that evidenced it (its ``entry`` /
 ``exit`` / ``mutation`` / boundary-state file), so provenance stays
-per-file even though parsing is per-chain.
+per-file even though parsing is per-chain. Sections are independent chains
+and are replayed in parallel worker processes; each is ingested as soon as
+its replay finishes, and a section whose replay fails is counted as errors
+without aborting the others.
 
 Safe to re-run — duplicates are detected by the UNIQUE constraint and
 skipped. Address validation is deferred; run ``wslcb backfill-addresses``
 afterward.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -88,6 +97,62 @@ def _build_work(
     return work, 0
 
 
+# Start method for replay workers. The parent holds a running event loop and
+# a live asyncpg pool, which must not be duplicated into children by fork.
+_REPLAY_MP_START_METHOD = "forkserver"
+
+_SectionReplay = tuple[str, list[Path], ReplayResult | Exception]
+
+
+async def _replay_sections(
+    work: list[tuple[str, list[Path]]],
+) -> AsyncGenerator[_SectionReplay, None]:
+    """Replay each section's diff chain, yielding results as they complete.
+
+    A chain must be replayed in order, but sections are independent chains,
+    so their CPU-bound parsing runs in parallel worker processes and each
+    result is handed back as soon as its chain is done — the caller ingests
+    it while slower chains are still replaying. A single section is
+    replayed in-process.
+
+    Yields ``(section_type, files, result)``; *result* is the exception
+    instead of a :class:`ReplayResult` when that chain failed, so one bad
+    section does not discard the others.
+    """
+    if len(work) <= 1:
+        for section_type, files in work:
+            try:
+                result: ReplayResult | Exception = replay_diff_chain(files, section_type)
+            except Exception as exc:  # noqa: BLE001 — reported per section by the caller
+                result = exc
+            yield section_type, files, result
+        return
+
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(
+        max_workers=min(len(work), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context(_REPLAY_MP_START_METHOD),
+    )
+
+    async def _replay(section_type: str, files: list[Path]) -> _SectionReplay:
+        try:
+            result = await loop.run_in_executor(pool, replay_diff_chain, files, section_type)
+        except Exception as exc:  # noqa: BLE001 — reported per section by the caller
+            return section_type, files, exc
+        return section_type, files, result
+
+    tasks = [asyncio.ensure_future(_replay(st, files)) for st, files in work]
+    try:
+        for done in asyncio.as_completed(tasks):
+            yield await done
+    finally:
+        # On an early close the caller is done with us: drop queued chains and
+        # return without blocking the event loop on chains still replaying.
+        for task in tasks:
+            task.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 async def _ingest_replay_result(
     engine: AsyncEngine,
     result: ReplayResult,
@@ -132,6 +197,23 @@ async def _ingest_replay_result(
             )
 
 
+async def _tally_section(
+    engine: AsyncEngine,
+    result: ReplayResult,
+    files: list[Path],
+    totals: dict[str, int],
+    *,
+    dry_run: bool,
+) -> None:
+    """Add one replayed section to *totals*, ingesting it unless *dry_run*."""
+    totals["files_processed"] += len(files) - result.stats["read_errors"]
+    totals["errors"] += result.stats["read_errors"]
+    if dry_run:
+        totals["inserted"] += len(result.records)
+        return
+    await _ingest_replay_result(engine, result, files, totals)
+
+
 async def backfill_diffs(
     engine: AsyncEngine,
     *,
@@ -157,16 +239,18 @@ async def backfill_diffs(
     work, unassigned = _build_work(section, single_file, limit)
     totals["errors"] += unassigned
 
-    for section_type, files in work:
-        result = replay_diff_chain(files, section_type)
-        totals["files_processed"] += len(files) - result.stats["read_errors"]
-        totals["errors"] += result.stats["read_errors"]
-
-        if dry_run:
-            totals["inserted"] += len(result.records)
-            continue
-
-        await _ingest_replay_result(engine, result, files, totals)
+    async with aclosing(_replay_sections(work)) as replays:
+        async for section_type, files, result in replays:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Replay failed for %s (%d files)",
+                    section_type,
+                    len(files),
+                    exc_info=result,
+                )
+                totals["errors"] += len(files)
+                continue
+            await _tally_section(engine, result, files, totals, dry_run=dry_run)
 
     logger.info(
         "Diff backfill complete: files=%d inserted=%d skipped=%d errors=%d",
@@ -45,6 +45,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from .address_client import close_shared_client
 from .address_validator import backfill_addresses as run_backfill_addresses
 from .address_validator import refresh_addresses as run_refresh_addresses
 from .address_validator import refresh_specific_addresses as run_refresh_specific_addresses
@@ -83,6 +84,8 @@ def _run_with_engine[T](coro_fn: Callable[[AsyncEngine], Awaitable[T]]) -> T:
             return await coro_fn(engine)
         finally:
             await engine.dispose()
+            # The shared address-API pool is bound to this run's event loop.
+            await close_shared_client()
 
     return asyncio.run(_go())
 
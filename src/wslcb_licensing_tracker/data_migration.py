@@ -69,10 +69,19 @@ async def run_pending_migrations(engine: AsyncEngine) -> None:
     the insert is the final guard — migration functions must therefore be
     idempotent (all registered migrations satisfy this requirement).
 
+    The applied set is read once up front, so a fully migrated database
+    costs one query at startup; only pending migrations get their own
+    connection and re-check.
+
     Runs migrations in registration order. Raises on the first failure
     (does not suppress).
     """
+    async with engine.connect() as conn:
+        applied = set((await conn.execute(select(data_migrations.c.name))).scalars())
     for name, fn in _MIGRATIONS:
+        if name in applied:
+            logger.debug("Data migration %r already applied — skipping", name)
+            continue
         async with engine.connect() as conn:
             already = (
                 await conn.execute(
@@ -404,6 +404,28 @@ async def link_record_source(
     await conn.execute(stmt)
 
 
+async def link_record_sources(
+    conn: AsyncConnection,
+    record_ids: list[int],
+    source_id: int,
+    role: str = "first_seen",
+) -> None:
+    """Link many license records to one source in a single INSERT (idempotent)."""
+    if not record_ids:
+        return
+    stmt = (
+        pg_insert(record_sources)
+        .values(
+            [
+                {"record_id": record_id, "source_id": source_id, "role": role}
+                for record_id in dict.fromkeys(record_ids)
+            ]
+        )
+        .on_conflict_do_nothing()
+    )
+    await conn.execute(stmt)
+
+
 # ------------------------------------------------------------------
 # Provenance query helpers
 # ------------------------------------------------------------------
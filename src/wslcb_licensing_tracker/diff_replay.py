@@ -100,15 +100,16 @@ def _parse_hunk_body(
     n = len(lines)
     while i < n and (old_seen < old_count or new_seen < new_count):
         bl = lines[i]
-        if bl.startswith("@@"):
+        tag = bl[:1]  # dispatch on the prefix char rather than repeated startswith()
+        if tag == "@" and bl.startswith("@@"):
             break
-        if bl.startswith("\\"):  # "\ No newline at end of file"
+        if tag == "\\":  # "\ No newline at end of file"
             i += 1
             continue
         body.append(bl)
-        if bl.startswith("+"):
+        if tag == "+":
             new_seen += 1
-        elif bl.startswith("-"):
+        elif tag == "-":
             old_seen += 1
         else:
             old_seen += 1
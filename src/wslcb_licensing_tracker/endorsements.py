@@ -15,7 +15,8 @@ import logging
 import re
 from datetime import UTC, datetime
 
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import Integer, any_, bindparam, delete, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -353,6 +354,10 @@ async def get_record_endorsements(
 
     Alias resolution is applied: if the endorsement linked to a record has an
     alias row, the canonical name is returned instead of the variant name.
+
+    The ids are bound as a single array parameter, so the statement text is
+    the same for every batch size and the prepared statement is reused.
+    Names arrive already grouped per record (``array_agg``), one row each.
     """
     if not record_ids:
         return {}
@@ -362,28 +367,27 @@ async def get_record_endorsements(
 
     result: dict[int, list[str]] = {rid: [] for rid in record_ids}
 
-    # Process in chunks to avoid huge IN clauses
-    chunk_size = 500
-    for i in range(0, len(record_ids), chunk_size):
-        batch = record_ids[i : i + chunk_size]
-        stmt = (
-            select(
-                record_endorsements.c.record_id,
-                func.coalesce(canonical_le.c.name, le.c.name).label("display_name"),
-            )
-            .select_from(record_endorsements)
-            .join(le, le.c.id == record_endorsements.c.endorsement_id)
-            .outerjoin(endorsement_aliases, endorsement_aliases.c.endorsement_id == le.c.id)
-            .outerjoin(
-                canonical_le,
-                canonical_le.c.id == endorsement_aliases.c.canonical_endorsement_id,
-            )
-            .where(record_endorsements.c.record_id.in_(batch))
-            .order_by(record_endorsements.c.record_id, text("display_name"))
+    display_name = func.coalesce(canonical_le.c.name, le.c.name)
+    stmt = (
+        select(
+            record_endorsements.c.record_id,
+            func.array_agg(aggregate_order_by(display_name, display_name)),
         )
-        rows = (await conn.execute(stmt)).mappings().all()
-        for r in rows:
-            result[r["record_id"]].append(r["display_name"])
+        .select_from(record_endorsements)
+        .join(le, le.c.id == record_endorsements.c.endorsement_id)
+        .outerjoin(endorsement_aliases, endorsement_aliases.c.endorsement_id == le.c.id)
+        .outerjoin(
+            canonical_le,
+            canonical_le.c.id == endorsement_aliases.c.canonical_endorsement_id,
+        )
+        .where(
+            record_endorsements.c.record_id
+            == any_(bindparam("record_ids", list(record_ids), type_=ARRAY(Integer)))
+        )
+        .group_by(record_endorsements.c.record_id)
+    )
+    for record_id, names in (await conn.execute(stmt)).all():
+        result[record_id] = list(names)
 
     return result
 
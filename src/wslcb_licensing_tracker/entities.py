@@ -11,7 +11,8 @@ import logging
 import re
 from datetime import UTC, datetime
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import Integer, any_, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -144,6 +145,8 @@ async def get_record_entities(
 
     Returns ``{record_id: {"applicant": [...], "previous_applicant": [...]}}``.
     Each entity dict has keys ``id``, ``name``, ``entity_type``.
+    The ids are bound as one array parameter so the statement is reused
+    whatever the batch size.
     """
     if not record_ids:
         return {}
@@ -152,42 +155,42 @@ async def get_record_entities(
         rid: {"applicant": [], "previous_applicant": []} for rid in record_ids
     }
 
-    chunk_size = 500
-    for i in range(0, len(record_ids), chunk_size):
-        batch = record_ids[i : i + chunk_size]
-        stmt = (
-            select(
-                record_entities.c.record_id,
-                record_entities.c.role,
-                record_entities.c.position,
-                entities.c.id.label("entity_id"),
-                entities.c.name,
-                entities.c.entity_type,
-            )
-            .select_from(record_entities)
-            .join(entities, entities.c.id == record_entities.c.entity_id)
-            .where(record_entities.c.record_id.in_(batch))
-            .order_by(
-                record_entities.c.record_id,
-                record_entities.c.role,
-                record_entities.c.position,
-            )
+    stmt = (
+        select(
+            record_entities.c.record_id,
+            record_entities.c.role,
+            record_entities.c.position,
+            entities.c.id.label("entity_id"),
+            entities.c.name,
+            entities.c.entity_type,
+        )
+        .select_from(record_entities)
+        .join(entities, entities.c.id == record_entities.c.entity_id)
+        .where(
+            record_entities.c.record_id
+            == any_(bindparam("record_ids", list(record_ids), type_=ARRAY(Integer)))
+        )
+        .order_by(
+            record_entities.c.record_id,
+            record_entities.c.role,
+            record_entities.c.position,
+        )
+    )
+    rows = (await conn.execute(stmt)).mappings().all()
+    for r in rows:
+        rid = r["record_id"]
+        role = r["role"]
+        if rid not in result:
+            result[rid] = {"applicant": [], "previous_applicant": []}
+        if role not in result[rid]:
+            result[rid][role] = []
+        result[rid][role].append(
+            {
+                "id": r["entity_id"],
+                "name": r["name"],
+                "entity_type": r["entity_type"],
+            }
         )
-        rows = (await conn.execute(stmt)).mappings().all()
-        for r in rows:
-            rid = r["record_id"]
-            role = r["role"]
-            if rid not in result:
-                result[rid] = {"applicant": [], "previous_applicant": []}
-            if role not in result[rid]:
-                result[rid][role] = []
-            result[rid][role].append(
-                {
-                    "id": r["entity_id"],
-                    "name": r["name"],
-                    "entity_type": r["entity_type"],
-                }
-            )
 
     return result
 
@@ -10,7 +10,8 @@ configurable date tolerance window.
 import logging
 from datetime import UTC, datetime
 
-from sqlalchemy import select, text
+from sqlalchemy import Integer, any_, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -559,7 +560,10 @@ async def get_record_links_bulk(
             outcome_lr.c.application_type.label("outcome_application_type"),
         )
         .join(outcome_lr, outcome_lr.c.id == record_links.c.outcome_id)
-        .where(record_links.c.new_app_id.in_(new_app_ids))
+        .where(
+            record_links.c.new_app_id
+            == any_(bindparam("new_app_ids", list(new_app_ids), type_=ARRAY(Integer)))
+        )
     )
     rows = (await conn.execute(stmt)).mappings().all()
     result: dict[int, dict] = {}
@@ -57,6 +57,11 @@ locations = Table(
     Index("idx_locations_std_city", "std_city"),
     Index("idx_locations_std_postal_code", "std_postal_code"),
     Index("idx_locations_attempted_at", "address_validation_attempted_at"),
+    # NOTE: migration 0009 creates this as a functional index on the folded
+    # address key upper(regexp_replace(btrim(raw_address), '\s+', ' ', 'g')) —
+    # see address_validator._address_key_sql. Same caveat as
+    # idx_entities_name_lower: the plain Index here intentionally differs.
+    Index("idx_locations_address_key", "raw_address"),
 )
 
 license_endorsements = Table(
@@ -160,7 +165,7 @@ license_records = Table(
         "application_type",
         name="uq_license_records_natural_key",
     ),
-    Index("idx_records_section", "section_type"),
+    Index("idx_records_section_date", "section_type", "record_date", "id"),
     Index("idx_records_date", "record_date"),
     Index("idx_records_business", "business_name"),
     Index("idx_records_license_num", "license_number"),
@@ -10,14 +10,19 @@ Extracted from ``scraper.py``, ``backfill_snapshots.py``, and
 ``backfill_diffs.py`` as part of the Phase 1 architecture refactor (#16).
 """
 
+import fnmatch
 import gzip
 import logging
 import re
+import sys
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +47,8 @@ SECTION_DIR_MAP = {
     "discontinued": "discontinued",
 }
 
-_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_ISO_DATE_LEN = 10  # YYYY-MM-DD
+_SNAPSHOT_DATE_RE = re.compile(r"(\d{4})_(\d{2})_(\d{2})")
 
 
 # ── Location / date helpers ──────────────────────────────────────────
@@ -112,6 +118,20 @@ _PRIMARY_FIELD = {
 }
 
 
+# Low-cardinality fields repeated across thousands of records. Interning them
+# shares one string object per distinct value, which shrinks both the backfill's
+# in-memory record sets and the pickles returned by replay worker processes.
+_INTERNED_FIELDS = (
+    "record_date",
+    "license_type",
+    "application_type",
+    "city",
+    "state",
+    "previous_city",
+    "previous_state",
+)
+
+
 def _empty_record(section_type: str, scraped_at: datetime, record_date: str = "") -> dict:
     """Return a fresh record dict with all fields zeroed."""
     return {
@@ -137,26 +157,47 @@ def _empty_record(section_type: str, scraped_at: datetime, record_date: str = ""
     }
 
 
+_text_nodes = etree.XPath(".//text()")
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def _lxml_text(el: lxml_html.HtmlElement) -> str:
+    """Return *el*'s text the way BeautifulSoup's ``get_text(strip=True)`` does."""
+    return "".join(s.strip() for s in _text_nodes(el))
+
+
+def _iter_label_values(
+    table: "BeautifulSoup | lxml_html.HtmlElement",
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(label, value)`` text for every two-cell row of *table*.
+
+    Accepts a BeautifulSoup tag (page snapshots, live scrapes) or a bare lxml
+    element (diff replay, which parses thousands of small fragments and skips
+    the BeautifulSoup tree layer).
+    """
+    if isinstance(table, lxml_html.HtmlElement):
+        for row in table.iter("tr"):
+            cells = list(row.iter("td"))
+            if len(cells) == _CELL_COUNT:
+                yield _lxml_text(cells[0]), _lxml_text(cells[1])
+        return
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) == _CELL_COUNT:
+            yield cells[0].get_text(strip=True), cells[1].get_text(strip=True)
+
+
 def parse_records_from_table(  # noqa: C901, PLR0912, PLR0915  # WSLCB field dispatch; not worth splitting
-    table: "BeautifulSoup",
+    table: "BeautifulSoup | lxml_html.HtmlElement",
     section_type: str,
 ) -> list[dict]:
-    """Parse all records from a section table."""
+    """Parse all records from a section table (BeautifulSoup tag or lxml element)."""
     records = []
-    rows = table.find_all("tr")
     date_field = DATE_FIELD_MAP[section_type]
     scraped_at = datetime.now(UTC)
     current = _empty_record(section_type, scraped_at)
 
-    for row in rows:
-        cells = row.find_all("td")
-        if len(cells) != _CELL_COUNT:
-            # If we have a partially built record, save it before skipping
-            continue
-
-        label = cells[0].get_text(strip=True)
-        value = cells[1].get_text(strip=True)
-
+    for label, value in _iter_label_values(table):
         if label == date_field:
             # Start of a new record — save previous if complete
             if current.get("license_number"):
@@ -226,6 +267,10 @@ def parse_records_from_table(  # noqa: C901, PLR0912, PLR0915  # WSLCB field dis
     if current.get("license_number"):
         records.append(current)
 
+    for rec in records:
+        for key in _INTERNED_FIELDS:
+            rec[key] = sys.intern(rec[key])
+
     return records
 
 
@@ -302,9 +347,17 @@ def glob_with_gz(dir_path: Path, pattern: str) -> list[Path]:
     When both a plain file and its ``.gz`` sibling exist, only the ``.gz``
     file is returned. Shared by ``snapshot_paths`` and diff-archive file
     discovery so both tolerate in-place gzip compression identically.
+    Both variants come from a single directory walk (``pattern + "*"``),
+    split by filename.
     """
-    plain = set(dir_path.glob(pattern))
-    gz = set(dir_path.glob(pattern + ".gz"))
+    name_pattern = pattern.rsplit("/", 1)[-1]
+    plain: set[Path] = set()
+    gz: set[Path] = set()
+    for p in dir_path.glob(pattern + "*"):
+        if fnmatch.fnmatchcase(p.name, name_pattern + ".gz"):
+            gz.add(p)
+        elif fnmatch.fnmatchcase(p.name, name_pattern):
+            plain.add(p)
     shadowed = {p.parent / p.name[: -len(".gz")] for p in gz}
     return sorted((plain - shadowed) | gz)
 
@@ -322,7 +375,7 @@ def extract_snapshot_date(path: Path) -> datetime | None:
 
     Works for both ``.html`` and ``.html.gz`` filenames.
     """
-    m = re.search(r"(\d{4})_(\d{2})_(\d{2})", path.name)
+    m = _SNAPSHOT_DATE_RE.search(path.name)
     if not m:
         return None
     return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=UTC)
@@ -331,13 +384,17 @@ def extract_snapshot_date(path: Path) -> datetime | None:
 def parse_snapshot(path: Path) -> list[dict]:
     """Parse a snapshot file and return a list of record dicts."""
     html = _read_snapshot(path)
-    soup = BeautifulSoup(html, "lxml")
+    if not html.strip():
+        return []
     records = []
-    for table in soup.find_all("table"):
-        th = table.find("th")
-        if not th:
+    # Parse from UTF-8 bytes: lxml rejects str input carrying an XML encoding
+    # declaration, and the text was already decoded by _read_snapshot.
+    root = lxml_html.fromstring(html.encode(), parser=_UTF8_HTML_PARSER)
+    for table in root.iter("table"):
+        th = table.find(".//th")
+        if th is None:
             continue
-        header = th.get_text(strip=True).replace("\xa0", " ")
+        header = _lxml_text(th).replace("\xa0", " ")
         if header not in SECTION_MAP:
             continue
         section_type = SECTION_MAP[header]
@@ -364,6 +421,8 @@ def parse_diff_timestamp(header_line: str) -> datetime:
 
 def split_diff_lines(
     content: str,
+    *,
+    with_context: bool = True,
 ) -> tuple[list[str], list[str], list[str], list[str], datetime, datetime]:
     """Split a unified diff into added, removed, and context line lists.
 
@@ -374,6 +433,9 @@ def split_diff_lines(
     - *new_with_ctx* / *old_with_ctx* include context lines on both sides.
     - *old_ts* / *new_ts* are timestamps extracted from the
       ``---`` / ``+++`` headers (used as ``scraped_at`` for recovered records).
+
+    With ``with_context=False`` the two context lists are returned empty,
+    sparing callers that only need the changed lines from building them.
     """
     added: list[str] = []
     removed: list[str] = []
@@ -384,23 +446,26 @@ def split_diff_lines(
     new_ts = fallback_ts
 
     for line in content.split("\n"):
-        if line.startswith("--- "):
-            old_ts = parse_diff_timestamp(line)
-            continue
-        if line.startswith("+++ "):
-            new_ts = parse_diff_timestamp(line)
-            continue
-        if line.startswith("@@"):
-            continue
-        if line.startswith("+"):
+        tag = line[:1]
+        if tag == "+":
+            if line.startswith("+++ "):
+                new_ts = parse_diff_timestamp(line)
+                continue
             stripped = line[1:]
             added.append(stripped)
-            new_ctx.append(stripped)
-        elif line.startswith("-"):
+            if with_context:
+                new_ctx.append(stripped)
+        elif tag == "-":
+            if line.startswith("--- "):
+                old_ts = parse_diff_timestamp(line)
+                continue
             stripped = line[1:]
             removed.append(stripped)
-            old_ctx.append(stripped)
-        else:
+            if with_context:
+                old_ctx.append(stripped)
+        elif tag == "@" and line.startswith("@@"):
+            continue
+        elif with_context:
             # Context line — belongs to both sides.
             new_ctx.append(line)
             old_ctx.append(line)
@@ -413,25 +478,42 @@ def parse_html_lines(lines: list[str], section_type: str) -> list[dict]:
     if not lines:
         return []
     html = "<table>" + "\n".join(lines) + "</table>"
-    soup = BeautifulSoup(html, "lxml")
-    table = soup.find("table")
-    if not table:
+    root = lxml_html.fromstring(html)
+    table = root if root.tag == "table" else root.find(".//table")
+    if table is None:
         return []
     return parse_records_from_table(table, section_type)
 
 
+def _is_iso_date(value: str) -> bool:
+    """Return True if *value* is shaped like ``YYYY-MM-DD``.
+
+    Checked by position rather than regex: it runs for every parsed record.
+    """
+    return (
+        len(value) == _ISO_DATE_LEN
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:].isdecimal()
+    )
+
+
 def is_valid_record(record: dict) -> bool:
     """Return True if a record has the minimum required fields."""
     return bool(
         record.get("section_type")
         and record.get("record_date")
-        and _ISO_DATE_RE.match(record.get("record_date", ""))
+        and _is_iso_date(record.get("record_date", ""))
         and record.get("license_number")
         and record.get("application_type")
     )
 
 
-def extract_records_from_diff(filepath: Path, section_type: str) -> list[dict]:
+def extract_records_from_diff(  # noqa: C901  # two-pass dedup; see docstring
+    filepath: Path, section_type: str
+) -> list[dict]:
     """Extract deduplicated, validated records from a single diff file.
 
     Two-pass strategy: a primary pass over the changed-only line stream,
@@ -458,22 +540,25 @@ def extract_records_from_diff(filepath: Path, section_type: str) -> list[dict]:
     do, and callers rely on decode errors surfacing as parse errors.
     """
     content = _read_text_strict(filepath)
-    added, removed, new_ctx, old_ctx, old_ts, new_ts = split_diff_lines(content)
+    added, removed, _, _, old_ts, new_ts = split_diff_lines(content, with_context=False)
 
     # ── Primary pass (no context) ──
-    primary: dict[tuple, dict] = {}
+    seen: set[tuple] = set()
+    records: list[dict] = []
     has_incomplete = False
     for lines, ts in ((added, new_ts), (removed, old_ts)):
         for rec in parse_html_lines(lines, section_type):
             if is_valid_record(rec):
-                rec["scraped_at"] = ts
                 key = (
                     rec["section_type"],
                     rec["record_date"],
                     rec["license_number"],
                     rec["application_type"],
                 )
-                primary.setdefault(key, rec)
+                if key not in seen:
+                    seen.add(key)
+                    rec["scraped_at"] = ts
+                    records.append(rec)
             elif rec.get("license_number"):
                 # Partial record — boundary artifact.
                 has_incomplete = True
@@ -481,11 +566,12 @@ def extract_records_from_diff(filepath: Path, section_type: str) -> list[dict]:
     # Fast path: skip the expensive supplemental parse when nothing
     # was incomplete in the primary pass.
     if not has_incomplete:
-        return list(primary.values())
+        return records
 
     # ── Supplemental pass (with context) ──
     # Only recover records whose full 4-tuple key is absent from the
-    # primary results.
+    # primary results. Context lists are built only now that they're needed.
+    _, _, new_ctx, old_ctx, _, _ = split_diff_lines(content)
     for lines, ts in ((new_ctx, new_ts), (old_ctx, old_ts)):
         for rec in parse_html_lines(lines, section_type):
             if is_valid_record(rec):
@@ -495,11 +581,12 @@ def extract_records_from_diff(filepath: Path, section_type: str) -> list[dict]:
                     rec["license_number"],
                     rec["application_type"],
                 )
-                if key not in primary:
+                if key not in seen:
+                    seen.add(key)
                     rec["scraped_at"] = ts
-                    primary.setdefault(key, rec)
+                    records.append(rec)
 
-    return list(primary.values())
+    return records
 
 
 # ── Source viewer: raw <tbody> extraction ──────────────────────────
@@ -698,7 +785,7 @@ def extract_tbody_from_diff(
     after ``compress-diffs`` renames the file on disk.
     """
     content = _read_text_strict(path)
-    added, removed, _new_ctx, _old_ctx, _old_ts, _new_ts = split_diff_lines(content)
+    added, removed, _, _, _, _ = split_diff_lines(content, with_context=False)
 
     for lines in (added, removed):
         for group in _extract_tbody_lines(lines):
@@ -7,11 +7,11 @@ import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from .db import get_or_create_location, link_record_source
+from .db import get_or_create_location, link_record_source, link_record_sources
 from .endorsements import process_record
 from .entities import ADDITIONAL_NAMES_MARKERS, parse_and_link_entities
 from .link_records import link_new_record
@@ -287,21 +287,109 @@ async def ingest_record(
                 )
 
     # Duplicate — link provenance as 'confirmed'
-    elif options.source_id is not None:
-        try:
+    else:
+        await _confirm_existing(conn, record_id, options)
+
+    return IngestResult(record_id=record_id, is_new=is_new)
+
+
+async def _confirm_existing(
+    conn: AsyncConnection,
+    record_id: int,
+    options: IngestOptions,
+) -> None:
+    """Link provenance as 'confirmed' for a record that already exists.
+
+    Runs in a savepoint so a failed link does not abort the outer transaction.
+    """
+    if options.source_id is None:
+        return
+    try:
+        async with conn.begin_nested():
             await link_record_source(
                 conn,
                 record_id,
                 options.source_id,
                 "confirmed",
             )
-        except Exception:
-            logger.exception(
-                "Error linking confirmed provenance for record %d",
-                record_id,
-            )
+    except Exception:
+        logger.exception(
+            "Error linking confirmed provenance for record %d",
+            record_id,
+        )
 
-    return IngestResult(record_id=record_id, is_new=is_new)
+
+async def _confirm_existing_bulk(
+    conn: AsyncConnection,
+    record_ids: list[int],
+    options: IngestOptions,
+) -> None:
+    """Link provenance as 'confirmed' for many existing records at once.
+
+    The bulk INSERT runs in a savepoint; if it fails, each record is linked
+    on its own through :func:`_confirm_existing`, so one bad row neither
+    aborts the outer transaction nor loses the rest of the batch.
+    """
+    if options.source_id is None or not record_ids:
+        return
+    try:
+        async with conn.begin_nested():
+            await link_record_sources(conn, record_ids, options.source_id, "confirmed")
+    except Exception:
+        logger.exception(
+            "Bulk confirmed-provenance link failed for %d records; linking one by one",
+            len(record_ids),
+        )
+        for record_id in record_ids:
+            await _confirm_existing(conn, record_id, options)
+
+
+def _natural_key(record: dict) -> tuple:
+    """Return the ``uq_license_records_natural_key`` tuple for a raw record."""
+    return (
+        record.get("section_type"),
+        record.get("record_date"),
+        record.get("license_number"),
+        record.get("application_type"),
+    )
+
+
+async def _existing_record_ids(
+    conn: AsyncConnection,
+    records: list[dict],
+) -> dict[tuple, int]:
+    """Map natural keys of already-stored *records* to their ids in one query."""
+    keys = {_natural_key(rec) for rec in records}
+    if not keys:
+        return {}
+    cols = (
+        license_records.c.section_type,
+        license_records.c.record_date,
+        license_records.c.license_number,
+        license_records.c.application_type,
+    )
+    rows = await conn.execute(
+        select(license_records.c.id, *cols).where(tuple_(*cols).in_(list(keys)))
+    )
+    return {tuple(row[1:]): row[0] for row in rows}
+
+
+async def _lookup_existing(
+    conn: AsyncConnection,
+    records: list[dict],
+) -> dict[tuple, int]:
+    """Run :func:`_existing_record_ids` in a savepoint, returning {} on failure.
+
+    A failed lookup only loses the shortcut: every record in the batch then
+    takes the normal :func:`ingest_record` path, which detects duplicates
+    and counts its own errors.
+    """
+    try:
+        async with conn.begin_nested():
+            return await _existing_record_ids(conn, records)
+    except Exception:
+        logger.exception("Existing-record lookup failed for %d records", len(records))
+        return {}
 
 
 async def ingest_batch(
@@ -312,12 +400,25 @@ async def ingest_batch(
     """Ingest multiple records with progress logging and batch commits.
 
     Commits every options.batch_size records to allow recovery from
-    interruption.
+    interruption.  Each batch's already-stored records are found with one
+    natural-key query up front and have their provenance confirmed in one
+    INSERT per batch, so re-running a backfill does not pay the full insert
+    path per duplicate.
     """
     result = BatchResult()
+    existing: dict[tuple, int] = {}
+    confirmed: list[int] = []
 
     for i, rec in enumerate(records):
-        ir = await ingest_record(conn, rec, options)
+        if i % options.batch_size == 0:
+            existing = await _lookup_existing(conn, records[i : i + options.batch_size])
+        record_id = existing.get(_natural_key(rec))
+        if record_id is not None:
+            # Known duplicate: skip the insert path; provenance is linked per batch.
+            confirmed.append(record_id)
+            ir = IngestResult(record_id=record_id, is_new=False)
+        else:
+            ir = await ingest_record(conn, rec, options)
         if ir is None:
             result.errors += 1
         elif ir.is_new:
@@ -327,6 +428,8 @@ async def ingest_batch(
             result.skipped += 1
 
         if (i + 1) % options.batch_size == 0:
+            await _confirm_existing_bulk(conn, confirmed, options)
+            confirmed.clear()
             await conn.commit()
             logger.debug(
                 "  progress: %d / %d (inserted=%d, skipped=%d, errors=%d)",
@@ -337,5 +440,6 @@ async def ingest_batch(
                 result.errors,
             )
 
+    await _confirm_existing_bulk(conn, confirmed, options)
     await conn.commit()
     return result
@@ -17,12 +17,17 @@ logger = logging.getLogger(__name__)
 
 
 async def get_entity_records(conn: AsyncConnection, entity_id: int) -> list[dict]:
-    """Fetch all records associated with an entity, with location data."""
+    """Fetch all records associated with an entity, with location data.
+
+    An entity linked to one record under both roles must still yield one
+    row; a semi-join on record_entities gives that without a DISTINCT over
+    every selected column.
+    """
     result = await conn.execute(
         text(
-            f"SELECT DISTINCT {RECORD_COLUMNS} {RECORD_JOINS}"
-            " JOIN record_entities re ON re.record_id = lr.id"
-            " WHERE re.entity_id = :entity_id"
+            f"SELECT {RECORD_COLUMNS} {RECORD_JOINS}"
+            " WHERE lr.id IN"
+            " (SELECT record_id FROM record_entities WHERE entity_id = :entity_id)"
             " ORDER BY lr.record_date DESC, lr.id DESC"
         ),
         {"entity_id": entity_id},
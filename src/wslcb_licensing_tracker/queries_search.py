@@ -7,10 +7,9 @@ Contains:
 - _build_where_clause() — parametric WHERE clause builder
 - search_records() — paginated search with filters
 - get_record_by_id() — single record with full hydration
-- get_related_records() — related records by license number (no hydration)
+- get_record_with_related() — record plus related records in one query (no hydration)
 - get_record_source_link() — record↔source existence check
 - get_source_by_id() — source row with source_type slug and label
-- get_record_link() — best outcome link for a new_application record
 """
 
 import logging
@@ -244,6 +243,16 @@ async def search_records(  # noqa: PLR0913
     total = count_result.scalar_one()
 
     offset = (page - 1) * per_page
+    # Nothing matches, or the page lies past the end: skip the row query.
+    if offset >= total:
+        logger.debug(
+            "search_records: 0/%d records, page %d, %.3fs",
+            total,
+            page,
+            time.perf_counter() - t0,
+        )
+        return [], total
+
     order_by = (
         "ts_rank(lr.search_vector, plainto_tsquery('english', :q_fts)) DESC,"
         " lr.record_date DESC, lr.id DESC"
@@ -285,17 +294,33 @@ async def get_record_by_id(conn: AsyncConnection, record_id: int) -> dict | None
     return hydrated[0]
 
 
-async def get_related_records(conn: AsyncConnection, record: dict) -> list[dict]:
-    """Fetch other records for the same license number."""
+async def get_record_with_related(
+    conn: AsyncConnection, record_id: int
+) -> tuple[dict | None, list[dict]]:
+    """Fetch a record and the other records for its license number in one query.
+
+    Returns ``(record, related)`` without hydration so the caller can hydrate
+    both in a single batch; ``(None, [])`` when the record does not exist.
+    """
     result = await conn.execute(
         text(
             f"{_RECORD_SELECT}"
-            " WHERE lr.license_number = :ln AND lr.id != :id"
+            " WHERE lr.id = :id OR lr.license_number ="
+            " (SELECT license_number FROM license_records WHERE id = :id)"
             " ORDER BY lr.record_date DESC"
         ),
-        {"ln": record["license_number"], "id": record["id"]},
+        {"id": record_id},
     )
-    return [dict(r) for r in result.mappings().all()]
+    record = None
+    related = []
+    for row in result.mappings().all():
+        if row["id"] == record_id:
+            record = dict(row)
+        else:
+            related.append(dict(row))
+    if record is None:
+        return None, []
+    return record, related
 
 
 async def get_record_source_link(conn: AsyncConnection, record_id: int, source_id: int) -> bool:
@@ -340,34 +365,3 @@ async def get_source_by_id(conn: AsyncConnection, source_id: int) -> dict | None
         .one_or_none()
     )
     return dict(row) if row is not None else None
-
-
-async def get_record_link(
-    conn: AsyncConnection,
-    record_id: int,
-) -> dict | None:
-    """Fetch the best outcome link for a new_application record.
-
-    Returns a dict with outcome_id, confidence, days_gap,
-    outcome_date, outcome_section_type, or None.
-    """
-    row = (
-        (
-            await conn.execute(
-                text("""
-                SELECT rl.outcome_id, rl.confidence, rl.days_gap,
-                       lr.record_date AS outcome_date,
-                       lr.section_type AS outcome_section_type
-                FROM record_links rl
-                JOIN license_records lr ON lr.id = rl.outcome_id
-                WHERE rl.new_app_id = :record_id
-                ORDER BY (rl.confidence = 'high') DESC
-                LIMIT 1
-            """),
-                {"record_id": record_id},
-            )
-        )
-        .mappings()
-        .one_or_none()
-    )
-    return dict(row) if row else None
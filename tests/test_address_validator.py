@@ -1,11 +1,12 @@
 """Tests for the address validation stack: transport client and DB layer."""
 
+import itertools
 import os
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 
 from wslcb_licensing_tracker.address_client import (
     DEFAULT_RETRY_AFTER,
@@ -16,19 +17,31 @@ from wslcb_licensing_tracker.address_client import (
     _parse_retry_after,
     _post_with_retry,
     standardize,
+    throttle_remaining,
     validate,
 )
 from wslcb_licensing_tracker.address_validator import (
     DAILY_VALIDATION_LIMIT,
     VALIDATION_TTL_DAYS,
+    _apply_location_results,
+    _RateLimiter,
     _validate_batch,
     backfill_addresses,
     process_location,
     standardize_location,
     validate_location,
+    validate_previous_location,
+    validate_record,
 )
 from wslcb_licensing_tracker.db import get_or_create_location
 from wslcb_licensing_tracker.models import locations
+from wslcb_licensing_tracker.pipeline import insert_record
+
+
+@pytest.fixture(autouse=True)
+def _clear_service_throttle(monkeypatch):
+    """Keep a back-off published by one retry test from delaying the next test."""
+    monkeypatch.setattr("wslcb_licensing_tracker.address_client._throttled_until", 0.0)
 
 
 class TestStandardizeLocation:
@@ -310,6 +323,19 @@ class TestPostWithRetry:
         assert result.status_code == 200
         assert mock_client.post.call_count == 2
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_429_publishes_shared_backoff(self):
+        retry_response = httpx.Response(HTTP_TOO_MANY_REQUESTS, headers={"Retry-After": "5"})
+        ok_response = httpx.Response(200, json={"ok": True})
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client.post.side_effect = [retry_response, ok_response]
+
+        with patch("wslcb_licensing_tracker.address_client.asyncio.sleep"):
+            await _post_with_retry(
+                "http://test/api", {"address": "x"}, {"X-API-Key": "k"}, mock_client, "test"
+            )
+        assert 4.0 < throttle_remaining() <= 5.0
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_exhausts_retries_on_persistent_429(self):
         retry_response = httpx.Response(HTTP_TOO_MANY_REQUESTS, headers={"Retry-After": "0.01"})
@@ -461,6 +487,35 @@ class TestValidateHTTP:
         assert result is None
 
 
+class TestSharedClient:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_reuses_client_across_calls(self):
+        from wslcb_licensing_tracker.address_client import close_shared_client, get_shared_client
+
+        first = get_shared_client()
+        assert get_shared_client() is first
+        await close_shared_client()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_recreated_after_close(self):
+        """A closed pool is replaced — each CLI run gets a client bound to its own loop."""
+        from wslcb_licensing_tracker.address_client import close_shared_client, get_shared_client
+
+        first = get_shared_client()
+        await close_shared_client()
+        second = get_shared_client()
+        assert second is not first
+        assert not second.is_closed
+        await close_shared_client()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_close_without_client_is_noop(self):
+        from wslcb_licensing_tracker.address_client import close_shared_client
+
+        await close_shared_client()
+        await close_shared_client()
+
+
 # ---------------------------------------------------------------------------
 # process_location — unified dispatcher
 # ---------------------------------------------------------------------------
@@ -706,17 +761,142 @@ class TestProcessLocation:
         assert result is False
 
 
+class TestValidateRecord:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_already_standardized_location_skips_api(self, pg_conn, standard_new_application):
+        """A record whose location is already standardized returns True without an API call."""
+        record_id, _ = await insert_record(pg_conn, standard_new_application)
+        await pg_conn.execute(
+            update(locations)
+            .where(locations.c.raw_address == standard_new_application["business_location"])
+            .values(address_standardized_at=func.now())
+        )
+        with (
+            patch(
+                "wslcb_licensing_tracker.address_validator.is_validation_enabled",
+                return_value=False,
+            ),
+            patch("wslcb_licensing_tracker.address_validator.standardize") as mock_std,
+        ):
+            result = await validate_record(pg_conn, record_id)
+        assert result is True
+        mock_std.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_missing_location_returns_false(self, pg_conn, standard_new_application):
+        """A record without a previous location has nothing to validate."""
+        record_id, _ = await insert_record(pg_conn, standard_new_application)
+        with patch("wslcb_licensing_tracker.address_validator.standardize") as mock_std:
+            result = await validate_previous_location(pg_conn, record_id)
+        assert result is False
+        mock_std.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_missing_record_returns_false(self, pg_conn):
+        assert await validate_record(pg_conn, -1) is False
+
+
+class TestApplyLocationResults:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_writes_each_result_shape(self, pg_conn):
+        """Standardized, confirmed and not_confirmed results land in one bulk call."""
+        loc_std = await get_or_create_location(pg_conn, "11 BULK ST, SEATTLE, WA 98101")
+        loc_ok = await get_or_create_location(pg_conn, "12 BULK ST, SEATTLE, WA 98101")
+        loc_bad = await get_or_create_location(pg_conn, "13 BULK ST, SEATTLE, WA 98101")
+        std_result = {
+            "address_line_1": "11 BULK ST",
+            "city": "SEATTLE",
+            "country": "US",
+            "standardized": "11 BULK ST, SEATTLE WA 98101",
+        }
+        not_confirmed = {"validation": {"status": "not_confirmed", "dpv_match_code": "N"}}
+
+        succeeded = await _apply_location_results(
+            pg_conn,
+            [
+                (loc_std, (False, std_result)),
+                (loc_ok, (True, MOCK_VALIDATE_RESULT)),
+                (loc_bad, (True, not_confirmed)),
+            ],
+        )
+
+        assert succeeded == 2  # not_confirmed does not count, as with process_location
+        rows = {
+            row["id"]: row
+            for row in (
+                await pg_conn.execute(
+                    select(
+                        locations.c.id,
+                        locations.c.std_city,
+                        locations.c.validation_status,
+                        locations.c.address_validated_at,
+                        locations.c.address_validation_attempted_at,
+                    ).where(locations.c.id.in_([loc_std, loc_ok, loc_bad]))
+                )
+            ).mappings()
+        }
+        assert rows[loc_std]["validation_status"] == "standardized"
+        assert rows[loc_std]["std_city"] == "SEATTLE"
+        assert rows[loc_std]["address_validation_attempted_at"] is None
+        assert rows[loc_ok]["validation_status"] == "confirmed"
+        assert rows[loc_ok]["std_city"] == "OLYMPIA"
+        assert rows[loc_ok]["address_validated_at"] is not None
+        assert rows[loc_bad]["validation_status"] == "not_confirmed"
+        assert rows[loc_bad]["std_city"] == ""
+        assert rows[loc_bad]["address_validation_attempted_at"] is not None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_rows_share_one_timestamp(self, pg_conn):
+        loc_a = await get_or_create_location(pg_conn, "14 BULK ST, SEATTLE, WA 98101")
+        loc_b = await get_or_create_location(pg_conn, "15 BULK ST, SEATTLE, WA 98101")
+        await _apply_location_results(
+            pg_conn,
+            [
+                (loc_a, (True, MOCK_VALIDATE_RESULT)),
+                (loc_b, (False, {"standardized": "15 BULK ST"})),
+            ],
+        )
+        stamps = (
+            (
+                await pg_conn.execute(
+                    select(locations.c.address_standardized_at).where(
+                        locations.c.id.in_([loc_a, loc_b])
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert len(set(stamps)) == 1
+
+
 # ---------------------------------------------------------------------------
 # _validate_batch — savepoint + periodic commit resilience
 # ---------------------------------------------------------------------------
 
 
+def _patch_bulk_failure():
+    """Make the bulk write fail so _validate_batch takes its row-by-row fallback."""
+    return patch(
+        "wslcb_licensing_tracker.address_validator._apply_location_results",
+        side_effect=RuntimeError("bulk write failed"),
+    )
+
+
+def _patch_fetch():
+    """Stub the API half of a batch run so tests drive only the DB-write half."""
+    return patch(
+        "wslcb_licensing_tracker.address_validator._fetch_location_result",
+        return_value=(False, {}),
+    )
+
+
 class TestValidateBatch:
     """Batch tests use pg_engine (not pg_conn) because _validate_batch commits internally."""
 
     @pytest.mark.asyncio(loop_scope="session")
     async def test_continues_after_row_failure(self, pg_engine):
-        """A failing row should not prevent subsequent rows from succeeding."""
+        """If the bulk write fails, the row-by-row fallback isolates the failing row."""
         async with pg_engine.connect() as conn:
             loc_ok = await get_or_create_location(conn, "400 GOOD ST, SEATTLE, WA 98101")
             loc_bad = await get_or_create_location(conn, "500 BAD ST, SEATTLE, WA 98102")
@@ -725,7 +905,7 @@ class TestValidateBatch:
 
         call_count = 0
 
-        async def mock_process(conn, location_id, address, client=None):
+        async def mock_apply(conn, location_id, fetched):
             nonlocal call_count
             call_count += 1
             if location_id == loc_bad:
@@ -744,9 +924,13 @@ class TestValidateBatch:
         ]
 
         async with pg_engine.connect() as conn:
-            with patch(
-                "wslcb_licensing_tracker.address_validator.process_location",
-                side_effect=mock_process,
+            with (
+                _patch_fetch(),
+                _patch_bulk_failure(),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_result",
+                    side_effect=mock_apply,
+                ),
             ):
                 result = await _validate_batch(
                     conn, rows, "Test batch", batch_size=100, rate_limit=0
@@ -775,9 +959,12 @@ class TestValidateBatch:
             await conn.commit()
 
         async with pg_engine.connect() as conn:
-            with patch(
-                "wslcb_licensing_tracker.address_validator.process_location",
-                return_value=True,
+            with (
+                _patch_fetch(),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=lambda _conn, writes: len(writes),
+                ),
             ):
                 result = await _validate_batch(
                     conn, locs, "Batch commit test", batch_size=2, rate_limit=0
@@ -787,9 +974,10 @@ class TestValidateBatch:
 
     @pytest.mark.asyncio(loop_scope="session")
     async def test_recovers_from_aborted_outer_transaction(self, pg_engine):
-        """When a row raises an error whose .orig contains InFailedSQLTransactionError,
-        _validate_batch rolls back the outer transaction and continues processing
-        subsequent rows rather than cascading the failure to every remaining row."""
+        """When a row in the row-by-row fallback raises an error whose .orig contains
+        InFailedSQLTransactionError, _validate_batch rolls back the outer transaction
+        and continues processing subsequent rows rather than cascading the failure to
+        every remaining row."""
         async with pg_engine.connect() as conn:
             loc_before = await get_or_create_location(conn, "900 BEFORE ST, SEATTLE, WA 98101")
             loc_abort = await get_or_create_location(conn, "901 ABORT ST, SEATTLE, WA 98102")
@@ -810,7 +998,7 @@ class TestValidateBatch:
                     "current transaction is aborted, commands ignored"
                 )
 
-        async def mock_process(conn, location_id, address, client=None):
+        async def mock_apply(conn, location_id, fetched):
             nonlocal call_count
             call_count += 1
             if location_id == loc_abort:
@@ -829,9 +1017,13 @@ class TestValidateBatch:
         ]
 
         async with pg_engine.connect() as conn:
-            with patch(
-                "wslcb_licensing_tracker.address_validator.process_location",
-                side_effect=mock_process,
+            with (
+                _patch_fetch(),
+                _patch_bulk_failure(),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_result",
+                    side_effect=mock_apply,
+                ),
             ):
                 result = await _validate_batch(
                     conn, rows, "Rollback recovery test", batch_size=100, rate_limit=0
@@ -858,6 +1050,309 @@ class TestValidateBatch:
         assert statuses[loc_abort] is None  # never updated
         assert statuses[loc_after] == "recovered_ok"  # committed after recovery
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_api_calls_overlap_up_to_concurrency(self, pg_engine):
+        """API calls run concurrently, bounded by *concurrency*; writes stay serial."""
+        import asyncio
+
+        async with pg_engine.connect() as conn:
+            rows = []
+            for i in range(6):
+                addr = f"{30 + i} PARALLEL AVE, SEATTLE, WA 98101"
+                rows.append({"id": await get_or_create_location(conn, addr), "raw_address": addr})
+            await conn.commit()
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_fetch(location_id, raw_address, client=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return (False, {})
+
+        async with pg_engine.connect() as conn:
+            with (
+                patch(
+                    "wslcb_licensing_tracker.address_validator._fetch_location_result",
+                    side_effect=mock_fetch,
+                ),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=lambda _conn, writes: len(writes),
+                ),
+            ):
+                result = await _validate_batch(
+                    conn, rows, "Concurrency test", batch_size=100, rate_limit=0, concurrency=3
+                )
+
+        assert result == 6
+        assert peak == 3
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_duplicate_addresses_share_one_api_call(self, pg_engine):
+        """Addresses differing only in case/spacing are fetched once and written to all."""
+        async with pg_engine.connect() as conn:
+            loc_a = await get_or_create_location(conn, "77 DUP ST, SEATTLE, WA 98101")
+            loc_b = await get_or_create_location(conn, "77  dup st,  Seattle, WA 98101")
+            loc_c = await get_or_create_location(conn, "78 OTHER ST, SEATTLE, WA 98101")
+            await conn.commit()
+
+        rows = [
+            {"id": loc_a, "raw_address": "77 DUP ST, SEATTLE, WA 98101"},
+            {"id": loc_b, "raw_address": "77  dup st,  Seattle, WA 98101"},
+            {"id": loc_c, "raw_address": "78 OTHER ST, SEATTLE, WA 98101"},
+        ]
+        applied: list[int] = []
+
+        async def mock_apply_many(conn, writes):
+            applied.extend(location_id for location_id, _ in writes)
+            return len(writes)
+
+        async with pg_engine.connect() as conn:
+            with (
+                _patch_fetch() as mock_fetch,
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply_many,
+                ),
+            ):
+                result = await _validate_batch(conn, rows, "Dedup test", rate_limit=0)
+
+        assert mock_fetch.call_count == 2
+        assert sorted(applied) == sorted([loc_a, loc_b, loc_c])
+        assert result == 3
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_shared_call_counts_every_row_against_budget(self, pg_engine):
+        """Twins sharing one /validate call are each stamped, so the budget counts rows."""
+        from sqlalchemy import func
+
+        from wslcb_licensing_tracker.address_validator import UTC, datetime
+
+        day_start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        attempted_today = (
+            select(func.count())
+            .select_from(locations)
+            .where(locations.c.address_validation_attempted_at >= day_start)
+        )
+        async with pg_engine.connect() as conn:
+            loc_a = await get_or_create_location(conn, "79 SHARE ST, SEATTLE, WA 98101")
+            loc_b = await get_or_create_location(conn, "79 share st,  Seattle, WA 98101")
+            await conn.commit()
+            used_before = (await conn.execute(attempted_today)).scalar_one()
+
+        rows = [
+            {"id": loc_a, "raw_address": "79 SHARE ST, SEATTLE, WA 98101"},
+            {"id": loc_b, "raw_address": "79 share st,  Seattle, WA 98101"},
+        ]
+        not_confirmed = (True, {"validation": {"status": "not_confirmed"}})
+        async with pg_engine.connect() as conn:
+            with patch(
+                "wslcb_licensing_tracker.address_validator._fetch_location_result",
+                return_value=not_confirmed,
+            ) as mock_fetch:
+                await _validate_batch(conn, rows, "Budget test", rate_limit=0)
+            used_after = (await conn.execute(attempted_today)).scalar_one()
+
+        assert mock_fetch.call_count == 1
+        assert used_after - used_before == 2  # rows attempted, not calls made
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_reuse_stored_skips_api_for_processed_twin(self, pg_engine):
+        """A fresh confirmed result on a case/spacing twin is copied without an API call."""
+        from wslcb_licensing_tracker.address_validator import UTC, datetime
+
+        async with pg_engine.connect() as conn:
+            donor = await get_or_create_location(conn, "55 TWIN ST, SEATTLE, WA 98101")
+            twin = await get_or_create_location(conn, "55 twin st,  SEATTLE, WA 98101")
+            now = datetime.now(UTC)
+            await conn.execute(
+                update(locations)
+                .where(locations.c.id == donor)
+                .values(
+                    std_address_line_1="55 TWIN ST",
+                    std_city="SEATTLE",
+                    std_address_string="55 TWIN ST, SEATTLE WA 98101",
+                    validation_status="confirmed",
+                    dpv_match_code="Y",
+                    address_standardized_at=now,
+                    address_validated_at=now,
+                    address_validation_attempted_at=now,
+                )
+            )
+            await conn.commit()
+
+        rows = [{"id": twin, "raw_address": "55 twin st,  SEATTLE, WA 98101"}]
+        async with pg_engine.connect() as conn:
+            with (
+                patch(
+                    "wslcb_licensing_tracker.address_validator.is_validation_enabled",
+                    return_value=True,
+                ),
+                _patch_fetch() as mock_fetch,
+            ):
+                result = await _validate_batch(
+                    conn, rows, "Reuse test", rate_limit=0, reuse_stored=True
+                )
+
+            row = (
+                (
+                    await conn.execute(
+                        select(
+                            locations.c.std_city,
+                            locations.c.std_address_string,
+                            locations.c.validation_status,
+                            locations.c.address_validated_at,
+                        ).where(locations.c.id == twin)
+                    )
+                )
+                .mappings()
+                .one()
+            )
+
+        mock_fetch.assert_not_called()
+        assert result == 1
+        assert row["std_city"] == "SEATTLE"
+        assert row["std_address_string"] == "55 TWIN ST, SEATTLE WA 98101"
+        assert row["validation_status"] == "confirmed"
+        assert row["address_validated_at"] is not None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_reuse_stored_keeps_donor_timestamps(self, pg_engine):
+        """A copied result keeps the freshest donor's stamps; only attempted_at is new."""
+        from datetime import timedelta
+
+        from wslcb_licensing_tracker.address_validator import UTC, datetime
+
+        now = datetime.now(UTC)
+        older = now - timedelta(days=VALIDATION_TTL_DAYS - 10)
+        newer = now - timedelta(days=VALIDATION_TTL_DAYS - 20)
+        async with pg_engine.connect() as conn:
+            donor_old = await get_or_create_location(conn, "56 AGED ST, SEATTLE, WA 98101")
+            donor_new = await get_or_create_location(conn, "56 aged st, SEATTLE, WA 98101")
+            twin = await get_or_create_location(conn, "56  AGED  ST, SEATTLE, WA 98101")
+            for loc_id, stamp, city in ((donor_old, older, "OLD"), (donor_new, newer, "NEW")):
+                await conn.execute(
+                    update(locations)
+                    .where(locations.c.id == loc_id)
+                    .values(
+                        std_address_line_1="56 AGED ST",
+                        std_city=city,
+                        std_address_string=f"56 AGED ST, {city} WA 98101",
+                        validation_status="confirmed",
+                        dpv_match_code="Y",
+                        address_standardized_at=stamp,
+                        address_validated_at=stamp,
+                        address_validation_attempted_at=stamp,
+                    )
+                )
+            await conn.commit()
+
+        rows = [{"id": twin, "raw_address": "56  AGED  ST, SEATTLE, WA 98101"}]
+        async with pg_engine.connect() as conn:
+            with (
+                patch(
+                    "wslcb_licensing_tracker.address_validator.is_validation_enabled",
+                    return_value=True,
+                ),
+                _patch_fetch() as mock_fetch,
+            ):
+                await _validate_batch(conn, rows, "Reuse test", rate_limit=0, reuse_stored=True)
+
+            row = (
+                (
+                    await conn.execute(
+                        select(
+                            locations.c.std_city,
+                            locations.c.address_standardized_at,
+                            locations.c.address_validated_at,
+                            locations.c.address_validation_attempted_at,
+                        ).where(locations.c.id == twin)
+                    )
+                )
+                .mappings()
+                .one()
+            )
+
+        mock_fetch.assert_not_called()
+        assert row["std_city"] == "NEW"  # freshest donor wins
+        assert row["address_standardized_at"] == newer
+        assert row["address_validated_at"] == newer
+        assert row["address_validation_attempted_at"] >= now
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_relaxed_commit_durability_is_transaction_scoped(self, pg_engine):
+        """Chunk writes run with synchronous_commit=off; the setting does not outlive them."""
+        from sqlalchemy import text
+
+        async with pg_engine.connect() as conn:
+            addr = "66 DURABLE ST, SEATTLE, WA 98101"
+            rows = [{"id": await get_or_create_location(conn, addr), "raw_address": addr}]
+            await conn.commit()
+
+        seen: list[str] = []
+
+        async def mock_apply_many(conn, writes):
+            seen.append((await conn.execute(text("SHOW synchronous_commit"))).scalar_one())
+            return len(writes)
+
+        async with pg_engine.connect() as conn:
+            with (
+                _patch_fetch(),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply_many,
+                ),
+            ):
+                await _validate_batch(conn, rows, "Durability test", rate_limit=0)
+            after = (await conn.execute(text("SHOW synchronous_commit"))).scalar_one()
+
+        assert seen == ["off"]
+        assert after == "on"
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_spaces_concurrent_starts(self):
+        import asyncio
+
+        limiter = _RateLimiter(0.05)
+        loop = asyncio.get_running_loop()
+        starts: list[float] = []
+
+        async def worker():
+            await limiter.wait()
+            starts.append(loop.time())
+
+        await asyncio.gather(*(worker() for _ in range(3)))
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_waits_out_service_backoff(self):
+        """A 429 seen by any caller delays the next start even with no spacing configured."""
+        import time
+
+        import wslcb_licensing_tracker.address_client as client_mod
+
+        client_mod._throttled_until = time.monotonic() + 3.0
+        limiter = _RateLimiter(0)
+        with patch("asyncio.sleep") as mock_sleep:
+            await limiter.wait()
+        (delay,), _ = mock_sleep.call_args
+        assert 2.5 < delay <= 3.0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_zero_interval_never_sleeps(self):
+        limiter = _RateLimiter(0)
+        with patch("asyncio.sleep") as mock_sleep:
+            await limiter.wait()
+            await limiter.wait()
+        mock_sleep.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # backfill_addresses — TTL-based renewal of already-validated locations (#150)
@@ -869,7 +1364,7 @@ class TestBackfillTTL:
     on address_validation_attempted_at, mode-aware, and bounded by a daily ceiling.
 
     Uses pg_engine because backfill_addresses -> _validate_batch commits internally.
-    process_location is mocked to capture which location ids the selector surfaces
+    _apply_location_results is mocked to capture which location ids the selector surfaces
     (and to leave attempted_at untouched, so the ceiling math is deterministic).
     """
 
@@ -877,11 +1372,11 @@ class TestBackfillTTL:
     def _capture():
         processed: list[int] = []
 
-        async def mock_process(conn, location_id, address, client=None):
-            processed.append(location_id)
-            return True
+        async def mock_apply_many(conn, writes):
+            processed.extend(location_id for location_id, _ in writes)
+            return len(writes)
 
-        return processed, mock_process
+        return processed, mock_apply_many
 
     @pytest.mark.asyncio(loop_scope="session")
     async def test_enabled_selects_stale_and_null_skips_fresh(self, pg_engine):
@@ -912,7 +1407,7 @@ class TestBackfillTTL:
             # null: never attempted -> must be selected
             await conn.commit()
 
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -923,9 +1418,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 await backfill_addresses(conn, rate_limit=0)
@@ -956,7 +1452,7 @@ class TestBackfillTTL:
             )
             await conn.commit()
 
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -967,9 +1463,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 await backfill_addresses(conn, rate_limit=0)
@@ -995,7 +1492,7 @@ class TestBackfillTTL:
             )
             await conn.commit()
 
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -1006,9 +1503,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 await backfill_addresses(conn, rate_limit=0)
@@ -1048,7 +1546,7 @@ class TestBackfillTTL:
             await conn.commit()
 
         cap = 3
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -1059,9 +1557,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 # budget = daily_limit - used_before = cap
@@ -1096,7 +1595,7 @@ class TestBackfillTTL:
                 )
             ).scalar_one()
 
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -1107,9 +1606,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 await backfill_addresses(conn, rate_limit=0, daily_limit=used_before)
@@ -1150,7 +1650,7 @@ class TestBackfillTTL:
                 )
             await conn.commit()
 
-        processed, mock_process = self._capture()
+        processed, mock_apply = self._capture()
         async with pg_engine.connect() as conn:
             with (
                 patch(
@@ -1161,9 +1661,10 @@ class TestBackfillTTL:
                     "wslcb_licensing_tracker.address_validator.get_api_key",
                     return_value="test-key",
                 ),
+                _patch_fetch(),
                 patch(
-                    "wslcb_licensing_tracker.address_validator.process_location",
-                    side_effect=mock_process,
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply,
                 ),
             ):
                 # budget = 2; there are >= 2 never-attempted rows, which sort first
@@ -1187,3 +1688,68 @@ class TestBackfillTTL:
     @pytest.mark.asyncio(loop_scope="session")
     async def test_default_daily_limit_is_constant(self):
         assert DAILY_VALIDATION_LIMIT == 5000
+
+
+class TestRefreshPaging:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_refresh_walks_every_location_once_across_pages(self, pg_engine):
+        """refresh_addresses reads locations in keyset pages; each row is seen exactly once."""
+        from wslcb_licensing_tracker.address_validator import refresh_addresses
+
+        async with pg_engine.connect() as conn:
+            created = [
+                await get_or_create_location(conn, f"{i} PAGE ST, SEATTLE, WA 98101")
+                for i in range(5)
+            ]
+            await conn.commit()
+
+        processed: list[int] = []
+
+        async def mock_apply_many(conn, writes):
+            processed.extend(location_id for location_id, _ in writes)
+            return len(writes)
+
+        async with pg_engine.connect() as conn:
+            with (
+                patch("wslcb_licensing_tracker.address_validator.LOCATION_PAGE_SIZE", 2),
+                patch(
+                    "wslcb_licensing_tracker.address_validator.get_api_key",
+                    return_value="test-key",
+                ),
+                _patch_fetch(),
+                patch(
+                    "wslcb_licensing_tracker.address_validator._apply_location_results",
+                    side_effect=mock_apply_many,
+                ),
+            ):
+                result = await refresh_addresses(conn, rate_limit=0)
+
+        assert len(processed) == len(set(processed))
+        assert set(created) <= set(processed)
+        assert result == len(processed)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_aborted_batch_stops_page_walk(self):
+        """Once a page's batch aborts, no further page query is sent on the broken conn."""
+        from unittest.mock import MagicMock
+
+        from wslcb_licensing_tracker.address_validator import _validate_pages
+
+        page = MagicMock()
+        page.mappings.return_value.all.return_value = [{"id": 1, "raw_address": "1 A ST"}]
+        conn = AsyncMock()
+        conn.execute.return_value = page
+        stmt = select(locations.c.id, locations.c.raw_address)
+
+        with (
+            patch("wslcb_licensing_tracker.address_validator.LOCATION_PAGE_SIZE", 1),
+            patch(
+                "wslcb_licensing_tracker.address_validator._run_batch",
+                return_value=(1, True),
+            ) as mock_run,
+        ):
+            result = await _validate_pages(conn, stmt, "Refreshing addresses", 100, 0)
+
+        assert result == 1
+        mock_run.assert_called_once()
+        conn.execute.assert_called_once()  # the first page query only
@@ -156,6 +156,39 @@ class TestCitiesEndpoint:
         resp = client.get("/api/v1/cities?state=WA")
         assert "cache-control" in resp.headers
 
+    def test_matching_etag_returns_304(self, client):
+        first = client.get("/api/v1/cities?state=WA")
+        etag = first.headers["etag"]
+        resp = client.get("/api/v1/cities?state=WA", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_weak_etag_returns_304(self, client):
+        etag = client.get("/api/v1/cities?state=WA").headers["etag"]
+        resp = client.get("/api/v1/cities?state=WA", headers={"If-None-Match": f"W/{etag}"})
+        assert resp.status_code == 304
+
+    def test_etag_in_list_returns_304(self, client):
+        etag = client.get("/api/v1/cities?state=WA").headers["etag"]
+        resp = client.get("/api/v1/cities?state=WA", headers={"If-None-Match": f'"stale", {etag}'})
+        assert resp.status_code == 304
+
+    def test_wildcard_etag_returns_304(self, client):
+        resp = client.get("/api/v1/cities?state=WA", headers={"If-None-Match": "*"})
+        assert resp.status_code == 304
+
+    def test_stale_etag_list_returns_body(self, client):
+        resp = client.get(
+            "/api/v1/cities?state=WA", headers={"If-None-Match": '"stale", W/"older"'}
+        )
+        assert resp.status_code == 200
+
+    def test_stale_etag_returns_body(self, client):
+        resp = client.get("/api/v1/cities?state=WA", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json()["data"] == ["SEATTLE", "TACOMA"]
+
 
 # ---------------------------------------------------------------------------
 # GET /api/v1/stats
@@ -123,14 +123,22 @@ class TestBuildId:
         assert "css_version" not in templates.env.globals
 
 
+class TestTemplateEnvironment:
+    def test_template_auto_reload_disabled(self):
+        """Compiled templates are reused without an mtime check per render."""
+        from wslcb_licensing_tracker.app import templates
+
+        assert templates.env.auto_reload is False
+
+
 def test_record_not_found_returns_404():
     """Unknown record_id must return 404."""
     mock_conn = AsyncMock()
     engine = MagicMock()
     engine.dispose = AsyncMock()
 
-    async def mock_get_record_by_id(conn, record_id):
-        return None
+    async def mock_get_record_with_related(conn, record_id):
+        return None, []
 
     with (
         patch("wslcb_licensing_tracker.app.create_engine_from_env", return_value=engine),
@@ -141,7 +149,10 @@ def test_record_not_found_returns_404():
             new_callable=AsyncMock,
             return_value=None,
         ),
-        patch("wslcb_licensing_tracker.app.get_record_by_id", new=mock_get_record_by_id),
+        patch(
+            "wslcb_licensing_tracker.app.get_record_with_related",
+            new=mock_get_record_with_related,
+        ),
     ):
         with TestClient(app) as client:
             resp = client.get("/record/999999")
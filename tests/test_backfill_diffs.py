@@ -3,6 +3,7 @@
 import difflib
 import gzip
 import os
+import time
 from datetime import UTC, datetime
 from email.utils import format_datetime
 from pathlib import Path
@@ -11,10 +12,17 @@ from unittest.mock import patch
 import pytest
 from sqlalchemy import text
 
-from wslcb_licensing_tracker.backfill_diffs import backfill_diffs, diff_section_dirs
+from wslcb_licensing_tracker.backfill_diffs import (
+    _replay_sections,
+    backfill_diffs,
+    diff_section_dirs,
+)
+from wslcb_licensing_tracker.diff_replay import replay_diff_chain
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
+_SLOW_REPLAY_SECONDS = 3
+
 _needs_db = pytest.mark.skipif(
     not os.environ.get("TEST_DATABASE_URL"),
     reason="requires TEST_DATABASE_URL",
@@ -76,6 +84,21 @@ def _write_notif_chain(data_dir: Path, states: list[list[str]]) -> list[Path]:
     return files
 
 
+def _replay_or_fail(files: list[Path], section_type: str):
+    """Replay stand-in for worker processes: the approvals chain blows up."""
+    if section_type == "approved":
+        msg = "corrupt approvals chain"
+        raise RuntimeError(msg)
+    return replay_diff_chain(files, section_type)
+
+
+def _replay_slow_approvals(files: list[Path], section_type: str):
+    """Replay stand-in for worker processes: the approvals chain takes a while."""
+    if section_type == "approved":
+        time.sleep(_SLOW_REPLAY_SECONDS)
+    return replay_diff_chain(files, section_type)
+
+
 # ── Fixtures ──────────────────────────────────────────────────────────
 
 
@@ -175,6 +198,79 @@ async def test_backfill_diffs_dry_run_limit_enforced(diff_data_dir):
     assert result["files_processed"] == 1
 
 
+@pytest.mark.asyncio
+async def test_backfill_diffs_dry_run_replays_sections_in_parallel(diff_data_dir):
+    """Several sections are replayed in worker processes; totals cover all of them."""
+    approvals_dir = diff_data_dir / "wslcb" / "licensinginfo-diffs" / "approvals"
+    approvals_dir.mkdir(parents=True)
+    (approvals_dir / "2025-06-16.txt").write_text(
+        (FIXTURES_DIR / "diff_two_records.txt").read_text()
+    )
+    with patch("wslcb_licensing_tracker.backfill_diffs.DATA_DIR", diff_data_dir):
+        result = await backfill_diffs(None, dry_run=True)
+    assert result["files_processed"] == 2
+    assert result["errors"] == 0
+    assert result["inserted"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_diffs_failed_section_counts_errors_and_keeps_others(diff_data_dir):
+    """A section whose replay raises is counted as errors; other sections still land."""
+    approvals_dir = diff_data_dir / "wslcb" / "licensinginfo-diffs" / "approvals"
+    approvals_dir.mkdir(parents=True)
+    (approvals_dir / "2025-06-16.txt").write_text(
+        (FIXTURES_DIR / "diff_two_records.txt").read_text()
+    )
+    with (
+        patch("wslcb_licensing_tracker.backfill_diffs.DATA_DIR", diff_data_dir),
+        patch("wslcb_licensing_tracker.backfill_diffs.replay_diff_chain", _replay_or_fail),
+    ):
+        result = await backfill_diffs(None, dry_run=True)
+    assert result["errors"] == 1
+    assert result["files_processed"] == 1
+    assert result["inserted"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_replay_sections_early_close_does_not_wait_for_pending(diff_data_dir):
+    """Closing the replay stream after the first section returns without joining the rest."""
+    notif_dir = diff_data_dir / "wslcb" / "licensinginfo-diffs" / "notifications"
+    approvals_dir = diff_data_dir / "wslcb" / "licensinginfo-diffs" / "approvals"
+    approvals_dir.mkdir(parents=True)
+    (approvals_dir / "2025-06-16.txt").write_text(
+        (FIXTURES_DIR / "diff_two_records.txt").read_text()
+    )
+    # Fast chain first, so it completes first even with a single worker.
+    work = [
+        ("new_application", [notif_dir / "2025-06-15.txt"]),
+        ("approved", [approvals_dir / "2025-06-16.txt"]),
+    ]
+    with patch("wslcb_licensing_tracker.backfill_diffs.replay_diff_chain", _replay_slow_approvals):
+        replays = _replay_sections(work)
+        section_type, _, result = await anext(replays)
+        started = time.monotonic()
+        await replays.aclose()
+        elapsed = time.monotonic() - started
+
+    assert section_type == "new_application"
+    assert not isinstance(result, Exception)
+    assert elapsed < _SLOW_REPLAY_SECONDS / 2
+
+
+@pytest.mark.asyncio
+async def test_backfill_diffs_failed_single_section_counts_errors(diff_data_dir):
+    """An in-process replay failure is counted as errors rather than raised."""
+    with (
+        patch("wslcb_licensing_tracker.backfill_diffs.DATA_DIR", diff_data_dir),
+        patch(
+            "wslcb_licensing_tracker.backfill_diffs.replay_diff_chain",
+            side_effect=RuntimeError("corrupt chain"),
+        ),
+    ):
+        result = await backfill_diffs(None, dry_run=True)
+    assert result == {"inserted": 0, "skipped": 0, "errors": 1, "files_processed": 0}
+
+
 @pytest.mark.asyncio
 async def test_backfill_diffs_dry_run_no_files_returns_zeros(tmp_path):
     """Empty data dir returns all-zero totals."""
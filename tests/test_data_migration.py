@@ -13,6 +13,16 @@ def _make_conn_always_applied():
     return conn
 
 
+def _make_conn_listing(names: list[str]):
+    """Return a fake connection whose up-front applied-set query returns *names*."""
+    conn = AsyncMock()
+    select_result = MagicMock()
+    select_result.scalars.return_value = iter(names)
+    conn.execute.return_value = select_result
+    conn.commit = AsyncMock()
+    return conn
+
+
 def _make_conn_not_applied():
     """Return a fake connection where the SELECT check returns None (not yet applied)."""
     conn = AsyncMock()
@@ -56,8 +66,8 @@ async def test_run_pending_migrations_all_applied():
     mock_fns = [AsyncMock() for _ in range(6)]
     patched_migrations = list(zip(all_names, mock_fns))
 
-    # One connection per migration, all reporting "already applied"
-    conns = [_make_conn_always_applied() for _ in range(6)]
+    # A single up-front query lists every migration as applied
+    conns = [_make_conn_listing(all_names)]
     fake_engine = _fake_engine_from_conns(conns)
 
     from wslcb_licensing_tracker import data_migration
@@ -67,8 +77,8 @@ async def test_run_pending_migrations_all_applied():
 
     for fn in mock_fns:
         fn.assert_not_called()
-    for conn in conns:
-        conn.commit.assert_not_called()
+    assert fake_engine.connect.call_count == 1
+    conns[0].commit.assert_not_called()
 
 
 async def test_run_pending_migrations_applies_pending():
@@ -85,8 +95,8 @@ async def test_run_pending_migrations_applies_pending():
     mock_fns = [AsyncMock() for _ in range(6)]
     patched_migrations = list(zip(all_names, mock_fns))
 
-    # One connection per migration, all reporting "not yet applied"
-    conns = [_make_conn_not_applied() for _ in range(6)]
+    # Empty applied set, then one connection per migration reporting "not yet applied"
+    conns = [_make_conn_listing([])] + [_make_conn_not_applied() for _ in range(6)]
     fake_engine = _fake_engine_from_conns(conns)
 
     from wslcb_licensing_tracker import data_migration
@@ -97,21 +107,28 @@ async def test_run_pending_migrations_applies_pending():
     for fn in mock_fns:
         fn.assert_called_once()
 
-    # Each connection must have been committed after the fn ran
-    for conn in conns:
+    # Each migration connection must have been committed after the fn ran
+    for conn in conns[1:]:
         conn.commit.assert_called_once()
 
 
-async def test_get_record_link_returns_none_when_no_row():
-    """get_record_link returns None when no matching row exists."""
-    conn = AsyncMock()
-    result = MagicMock()
-    result.mappings.return_value.one_or_none.return_value = None
-    conn.execute.return_value = result
+async def test_run_pending_migrations_rechecks_pending_on_own_connection():
+    """A migration missing from the up-front set is re-checked before it runs."""
+    names = ["0001_seed_endorsements", "0002_repair_code_name_endorsements"]
+    mock_fns = [AsyncMock() for _ in names]
 
-    from wslcb_licensing_tracker.queries_search import get_record_link
+    # 0001 applied up front; 0002 pending but applied by a concurrent process meanwhile
+    conns = [_make_conn_listing(names[:1]), _make_conn_always_applied()]
+    fake_engine = _fake_engine_from_conns(conns)
+
+    from wslcb_licensing_tracker import data_migration
 
-    assert await get_record_link(conn, 999) is None
+    with patch.object(data_migration, "_MIGRATIONS", list(zip(names, mock_fns))):
+        await data_migration.run_pending_migrations(fake_engine)
+
+    for fn in mock_fns:
+        fn.assert_not_called()
+    assert fake_engine.connect.call_count == 2
 
 
 async def test_get_entity_by_id_returns_none_when_not_found():
@@ -15,6 +15,7 @@ from wslcb_licensing_tracker.db import (
     get_primary_source,
     get_record_sources,
     link_record_source,
+    link_record_sources,
 )
 from wslcb_licensing_tracker.models import (
     license_records,
@@ -207,6 +208,19 @@ class TestPgLinkRecordSource:
         )
         assert len(result.all()) == 2
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_link_dedupes_and_is_idempotent(self, pg_conn):
+        """Repeated ids in one call and repeated calls both leave a single row."""
+        record_id, source_id = await self._seed_data(pg_conn)
+        await link_record_sources(pg_conn, [record_id, record_id], source_id, "confirmed")
+        await link_record_sources(pg_conn, [record_id], source_id, "confirmed")
+        await link_record_sources(pg_conn, [], source_id, "confirmed")
+
+        result = await pg_conn.execute(
+            select(record_sources.c.role).where(record_sources.c.record_id == record_id)
+        )
+        assert result.scalars().all() == ["confirmed"]
+
 
 class TestPgGetPrimarySource:
     async def _seed_record(self, pg_conn):
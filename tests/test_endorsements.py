@@ -75,6 +75,17 @@ class TestProcessRecord:
         endorsements = await get_record_endorsements(pg_conn, [record_id])
         assert endorsements[record_id].count("SPIRITS RETAILER") == 1
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_record_endorsements_grouped_and_sorted(self, pg_conn, standard_new_application):
+        """Names come back sorted per record; ids without links map to []."""
+        standard_new_application["license_number"] = "endorse_003b"
+        record_id = (await insert_record(pg_conn, standard_new_application))[0]
+        await process_record(pg_conn, record_id, "SPIRITS RETAILER; BEER DISTRIBUTOR")
+        endorsements = await get_record_endorsements(pg_conn, [record_id, -1])
+        assert endorsements[record_id] == sorted(endorsements[record_id])
+        assert "SPIRITS RETAILER" in endorsements[record_id]
+        assert endorsements[-1] == []
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_code_name_format(self, pg_conn, standard_new_application):
         """Test CODE, NAME format creates endorsement and maps the code."""
@@ -60,6 +60,18 @@ class TestParseAndLinkEntities:
         applicants = entity_map[record_id].get("applicant", [])
         assert len(applicants) >= 1
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_record_entities_large_id_list(self, pg_conn, standard_new_application):
+        """More ids than a single IN list used to carry are fetched in one array query."""
+        standard_new_application["license_number"] = "entity_002b"
+        record_id = (await insert_record(pg_conn, standard_new_application))[0]
+        await parse_and_link_entities(pg_conn, record_id, "ACME CANNABIS CO; JOHN DOE")
+        ids = [*range(-1200, 0), record_id]
+        entity_map = await get_record_entities(pg_conn, ids)
+        assert len(entity_map) == len(ids)
+        assert entity_map[record_id]["applicant"]
+        assert entity_map[-1] == {"applicant": [], "previous_applicant": []}
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_idempotent(self, pg_conn, standard_new_application):
         standard_new_application["license_number"] = "entity_003"
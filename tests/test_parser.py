@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
 from wslcb_licensing_tracker.parser import (
     SECTION_MAP,
@@ -23,6 +24,7 @@ from wslcb_licensing_tracker.parser import (
     parse_records_from_table,
     parse_snapshot,
     snapshot_paths,
+    split_diff_lines,
 )
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -281,6 +283,18 @@ class TestParseSnapshot:
         assert counts["approved"] == 1
         assert counts["discontinued"] == 1
 
+    def test_xml_declaration_is_tolerated(self, tmp_path):
+        """A leading XML encoding declaration doesn't break parsing."""
+        html = (FIXTURES_DIR / "full_snapshot.html").read_text()
+        p = tmp_path / "decl.html"
+        p.write_text('<?xml version="1.0" encoding="utf-8"?>\n' + html)
+        assert len(parse_snapshot(p)) == 3
+
+    def test_empty_file_returns_no_records(self, tmp_path):
+        p = tmp_path / "empty.html"
+        p.write_text("")
+        assert parse_snapshot(p) == []
+
 
 # ── is_valid_record ─────────────────────────────────────────────────
 
@@ -305,6 +319,13 @@ class TestIsValidRecord:
         standard_new_application["record_date"] = "6/15/2025"  # not ISO
         assert is_valid_record(standard_new_application) is False
 
+    @pytest.mark.parametrize(
+        "record_date", ["2025-6-15", "2025/06/15", "2025-06-1x", "2025-06-150"]
+    )
+    def test_malformed_iso_date(self, standard_new_application, record_date):
+        standard_new_application["record_date"] = record_date
+        assert is_valid_record(standard_new_application) is False
+
     def test_missing_date(self, standard_new_application):
         standard_new_application["record_date"] = ""
         assert is_valid_record(standard_new_application) is False
@@ -330,6 +351,33 @@ class TestEdgeCases:
         records = _load_table("new_applications.html")
         assert len(records) == 2
 
+    @pytest.mark.parametrize(
+        ("fixture_name", "section_type"),
+        [
+            ("new_applications.html", "new_application"),
+            ("assumption_record.html", "new_application"),
+            ("change_of_location.html", "new_application"),
+            ("approved_section.html", "approved"),
+            ("discontinued_section.html", "discontinued"),
+        ],
+    )
+    def test_lxml_element_parses_like_beautifulsoup(self, fixture_name, section_type):
+        """A bare lxml <table> element yields the same records as its BeautifulSoup parse."""
+        html = (FIXTURES_DIR / fixture_name).read_text()
+        via_lxml = parse_records_from_table(lxml_html.fromstring(html), section_type)
+        via_bs4 = _load_table(fixture_name, section_type)
+        for rec in via_lxml + via_bs4:
+            del rec["scraped_at"]
+        assert via_lxml
+        assert via_lxml == via_bs4
+
+    def test_repeated_field_values_are_interned(self):
+        """Low-cardinality fields share one string object across parses."""
+        first = _load_table("new_applications.html")
+        second = _load_table("new_applications.html")
+        assert first[0]["license_type"] is second[0]["license_type"]
+        assert first[0]["record_date"] is second[0]["record_date"]
+
     def test_no_matching_sections_in_page(self, tmp_path):
         """A page with no recognized section headers returns empty."""
         html = "<html><body><table><tr><td>Nothing here</td></tr></table></body></html>"
@@ -450,6 +498,16 @@ class TestGlobWithGz:
         paths = glob_with_gz(tmp_path, "*.txt")
         assert paths == [tmp_path / "a.txt", tmp_path / "b.txt"]
 
+    def test_recursive_pattern_skips_near_miss_suffixes(self, tmp_path):
+        nested = tmp_path / "2025" / "2025_06_15"
+        nested.mkdir(parents=True)
+        (nested / "a.html").write_text("x")
+        (nested / "b.html.gz").write_bytes(gzip.compress(b"x"))
+        (nested / "c.html.bak").write_text("x")
+        (nested / "d.html.gz.tmp").write_text("x")
+        paths = glob_with_gz(tmp_path, "**/*.html")
+        assert paths == [nested / "a.html", nested / "b.html.gz"]
+
 
 class TestParseSnapshotGz:
     def test_parse_gz_snapshot_returns_same_records(self, tmp_path):
@@ -657,6 +715,31 @@ class TestParseDiffTimestamp:
         assert isinstance(result, datetime)
 
 
+class TestSplitDiffLines:
+    _DIFF = (
+        "--- @\tWed, 07 Sep 2022 06:15:05 -0700\n"
+        "+++ @\tWed, 07 Sep 2022 07:15:05 -0700\n"
+        "@@ -1,2 +1,2 @@\n"
+        " ctx\n"
+        "-old\n"
+        "+new"
+    )
+
+    def test_with_context_includes_context_lines(self):
+        added, removed, new_ctx, old_ctx, _, _ = split_diff_lines(self._DIFF)
+        assert (added, removed) == (["new"], ["old"])
+        assert new_ctx == [" ctx", "new"]
+        assert old_ctx == [" ctx", "old"]
+
+    def test_without_context_skips_context_lists(self):
+        added, removed, new_ctx, old_ctx, old_ts, new_ts = split_diff_lines(
+            self._DIFF, with_context=False
+        )
+        assert (added, removed) == (["new"], ["old"])
+        assert new_ctx == old_ctx == []
+        assert new_ts > old_ts
+
+
 # ── extract_records_from_diff (.gz support) ──────────────────────────
 
 
@@ -4,9 +4,10 @@ Requires TEST_DATABASE_URL env var pointing at a running PostgreSQL instance.
 """
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from wslcb_licensing_tracker.models import (
@@ -371,3 +372,121 @@ async def test_pg_ingest_batch(pg_engine, standard_new_application):
                 license_records.delete().where(license_records.c.license_number.like("BATCH%"))
             )
             await conn.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pg_ingest_batch_rerun_skips_insert_path(pg_engine, standard_new_application):
+    """Re-ingesting stored records counts them as skipped without calling insert_record."""
+    records = []
+    for i in range(3):
+        rec = dict(standard_new_application)
+        rec["license_number"] = f"RERUN{i:04d}"
+        records.append(rec)
+    options = IngestOptions(link_outcomes=False, batch_size=2)
+
+    async with pg_engine.connect() as conn:
+        try:
+            first = await ingest_batch(conn, records, options)
+            assert first.inserted == 3
+            with patch("wslcb_licensing_tracker.pipeline.insert_record") as mock_insert:
+                second = await ingest_batch(conn, records, options)
+            mock_insert.assert_not_called()
+            assert second.inserted == 0
+            assert second.skipped == 3
+            assert second.errors == 0
+        finally:
+            await conn.execute(
+                license_records.delete().where(license_records.c.license_number.like("RERUN%"))
+            )
+            await conn.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pg_ingest_batch_lookup_failure_falls_back(pg_engine, standard_new_application):
+    """A failed existing-record lookup is logged; records still go through ingest_record."""
+    records = []
+    for i in range(3):
+        rec = dict(standard_new_application)
+        rec["license_number"] = f"LOOKUPFAIL{i:04d}"
+        records.append(rec)
+    options = IngestOptions(link_outcomes=False, batch_size=2)
+
+    async def failing_lookup(conn, _records):
+        await conn.execute(text("SELECT 1 / 0"))  # real DB error inside the savepoint
+
+    async with pg_engine.connect() as conn:
+        try:
+            with patch(
+                "wslcb_licensing_tracker.pipeline._existing_record_ids",
+                side_effect=failing_lookup,
+            ):
+                first = await ingest_batch(conn, records, options)
+                second = await ingest_batch(conn, records, options)
+            assert (first.inserted, first.skipped, first.errors) == (3, 0, 0)
+            assert (second.inserted, second.skipped, second.errors) == (0, 3, 0)
+        finally:
+            await conn.execute(
+                license_records.delete().where(license_records.c.license_number.like("LOOKUPFAIL%"))
+            )
+            await conn.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pg_ingest_batch_bulk_confirm_failure_links_one_by_one(
+    pg_engine, standard_new_application
+):
+    """A failed bulk provenance insert falls back to per-record links; the batch survives."""
+    records = []
+    for i in range(3):
+        rec = dict(standard_new_application)
+        rec["license_number"] = f"CONFIRMFAIL{i:04d}"
+        records.append(rec)
+
+    async def failing_bulk_link(conn, *_args):
+        await conn.execute(text("SELECT 1 / 0"))  # real DB error inside the savepoint
+
+    async with pg_engine.connect() as conn:
+        try:
+            await conn.execute(
+                pg_insert(source_types)
+                .values(id=1, slug="live_scrape", label="Live Scrape")
+                .on_conflict_do_nothing()
+            )
+            source_id = (
+                await conn.execute(
+                    pg_insert(sources)
+                    .values(source_type_id=1, snapshot_path="test/confirm-fail.html")
+                    .on_conflict_do_update(
+                        index_elements=[sources.c.source_type_id, sources.c.snapshot_path],
+                        set_={"snapshot_path": "test/confirm-fail.html"},
+                    )
+                    .returning(sources.c.id)
+                )
+            ).scalar_one()
+            await conn.commit()
+
+            first = await ingest_batch(conn, records, IngestOptions(link_outcomes=False))
+            options = IngestOptions(link_outcomes=False, source_id=source_id, batch_size=2)
+            with patch(
+                "wslcb_licensing_tracker.pipeline.link_record_sources",
+                side_effect=failing_bulk_link,
+            ):
+                second = await ingest_batch(conn, records, options)
+            assert (second.skipped, second.errors) == (3, 0)
+
+            linked = (
+                await conn.execute(
+                    select(record_sources.c.record_id).where(
+                        record_sources.c.source_id == source_id,
+                        record_sources.c.role == "confirmed",
+                    )
+                )
+            ).scalars()
+            assert set(first.record_ids) <= set(linked)
+        finally:
+            await conn.execute(
+                license_records.delete().where(
+                    license_records.c.license_number.like("CONFIRMFAIL%")
+                )
+            )
+            await conn.commit()
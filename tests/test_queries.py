@@ -7,14 +7,16 @@ from wslcb_licensing_tracker.db import (
     get_or_create_source,
     link_record_source,
 )
+from wslcb_licensing_tracker.entities import get_record_entities, parse_and_link_entities
 from wslcb_licensing_tracker.pipeline import insert_record
 from wslcb_licensing_tracker.queries_entity import get_entity_records
 from wslcb_licensing_tracker.queries_export import export_records, export_records_cursor
+from wslcb_licensing_tracker.queries_filter import get_filter_options
 from wslcb_licensing_tracker.queries_hydrate import enrich_record
 from wslcb_licensing_tracker.queries_search import (
     get_record_by_id,
     get_record_source_link,
-    get_related_records,
+    get_record_with_related,
     get_source_by_id,
     search_records,
 )
@@ -82,6 +84,17 @@ class TestSearchRecords:
         records, total = await search_records(pg_conn, section_type="new_application")
         assert all(r["section_type"] == "new_application" for r in records)
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_page_past_end_returns_total_without_rows(
+        self, pg_conn, standard_new_application
+    ):
+        standard_new_application["license_number"] = "query_003b"
+        await insert_record(pg_conn, standard_new_application)
+        _, total = await search_records(pg_conn)
+        records, past_total = await search_records(pg_conn, page=total + 1, per_page=1)
+        assert records == []
+        assert past_total == total
+
 
 class TestExportRecords:
     @pytest.mark.asyncio(loop_scope="session")
@@ -129,14 +142,37 @@ class TestGetRecordById:
         assert record is None
 
 
-class TestGetRelatedRecords:
+class TestGetRecordWithRelated:
     @pytest.mark.asyncio(loop_scope="session")
-    async def test_returns_list(self, pg_conn, standard_new_application):
-        standard_new_application["license_number"] = "query_008"
-        result = await insert_record(pg_conn, standard_new_application)
-        record = await get_record_by_id(pg_conn, result[0])
-        related = await get_related_records(pg_conn, record)
-        assert isinstance(related, list)
+    async def test_splits_record_from_related(self, pg_conn, standard_new_application):
+        standard_new_application["license_number"] = "query_009"
+        first = await insert_record(pg_conn, standard_new_application)
+        standard_new_application["record_date"] = "2025-07-01"
+        standard_new_application["application_type"] = "RENEWAL"
+        second = await insert_record(pg_conn, standard_new_application)
+        record, related = await get_record_with_related(pg_conn, first[0])
+        assert record["id"] == first[0]
+        assert [r["id"] for r in related] == [second[0]]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_returns_none_for_missing(self, pg_conn):
+        assert await get_record_with_related(pg_conn, 999999999) == (None, [])
+
+
+class TestGetFilterOptions:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_distinct_non_empty_values(self, pg_conn, standard_new_application):
+        standard_new_application["license_number"] = "query_010"
+        await insert_record(pg_conn, standard_new_application)
+        standard_new_application["application_type"] = ""
+        await insert_record(pg_conn, standard_new_application)
+        options = await get_filter_options(pg_conn)
+        for col in ("section_type", "application_type"):
+            values = options[col]
+            assert len(values) == len(set(values))
+            assert "" not in values
+        assert "new_application" in options["section_type"]
+        assert "NEW APPLICATION" in options["application_type"]
 
 
 class TestGetEntityRecords:
@@ -147,6 +183,21 @@ class TestGetEntityRecords:
         assert isinstance(records, list)
         assert records == []
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_record_linked_under_both_roles_listed_once(
+        self, pg_conn, standard_new_application
+    ):
+        standard_new_application["license_number"] = "query_011"
+        record_id = (await insert_record(pg_conn, standard_new_application))[0]
+        await parse_and_link_entities(pg_conn, record_id, "ACME LLC; DUAL ROLE PERSON")
+        await parse_and_link_entities(
+            pg_conn, record_id, "ACME LLC; DUAL ROLE PERSON", role="previous_applicant"
+        )
+        entity_map = await get_record_entities(pg_conn, [record_id])
+        entity_id = entity_map[record_id]["applicant"][0]["id"]
+        records = await get_entity_records(pg_conn, entity_id)
+        assert [r["id"] for r in records] == [record_id]
+
 
 class TestGetSourceById:
     @pytest.mark.asyncio(loop_scope="session")
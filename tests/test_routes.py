@@ -10,6 +10,7 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from wslcb_licensing_tracker.app import app
@@ -256,6 +257,55 @@ class TestSearchPlaceholder:
             _stop(patches)
 
 
+class TestSearchPartial:
+    """HTMX partial search responses skip the filter-form queries."""
+
+    def test_partial_skips_filter_queries(self):
+        client, patches = _make_client()
+        try:
+            with (
+                patch("wslcb_licensing_tracker.app.get_filter_options") as mock_filters,
+                patch("wslcb_licensing_tracker.app.get_cities_for_state") as mock_cities,
+            ):
+                resp = client.get("/search?state=WA", headers={"HX-Request": "true"})
+            assert resp.status_code == 200
+            assert "<html" not in resp.text
+            mock_filters.assert_not_called()
+            mock_cities.assert_not_called()
+        finally:
+            _stop(patches)
+
+    def test_export_url_omits_empty_filters(self):
+        client, patches = _make_client()
+        try:
+            with patch(
+                "wslcb_licensing_tracker.app.search_records",
+                new_callable=AsyncMock,
+                return_value=([], 1),
+            ):
+                resp = client.get(
+                    "/search?q=acme&state=&endorsement=BEER",
+                    headers={"HX-Request": "true"},
+                )
+            assert 'href="/api/v1/export?q=acme&amp;endorsement=BEER"' in resp.text
+        finally:
+            _stop(patches)
+
+    def test_full_page_loads_filters(self):
+        client, patches = _make_client()
+        try:
+            with patch(
+                "wslcb_licensing_tracker.app.get_filter_options",
+                new_callable=AsyncMock,
+                return_value=_EMPTY_FILTERS,
+            ) as mock_filters:
+                resp = client.get("/search")
+            assert resp.status_code == 200
+            mock_filters.assert_awaited_once()
+        finally:
+            _stop(patches)
+
+
 # ---------------------------------------------------------------------------
 # Quick Search button wrapping (#47)
 # ---------------------------------------------------------------------------
@@ -532,14 +582,11 @@ class TestAdditionalNamesNotice:
         }
 
     def _make_client_for_record(self, record_dict):
-        """Return a (client, patches) pair with get_record_by_id mocked."""
+        """Return a (client, patches) pair with get_record_with_related mocked."""
         mock_conn = AsyncMock()
 
-        async def _get_record_by_id(conn, record_id):
-            return record_dict
-
-        async def _get_related_records(conn, record):
-            return []
+        async def _get_record_with_related(conn, record_id):
+            return record_dict, []
 
         async def _hydrate_records(conn, rows):
             return rows
@@ -547,15 +594,9 @@ class TestAdditionalNamesNotice:
         async def _get_record_sources(conn, record_id):
             return []
 
-        async def _get_record_link(conn, record_id):
-            return None
-
         async def _get_reverse_link_info(conn, record):
             return None
 
-        def _get_outcome_status(record, link):
-            return {"status": None}
-
         @asynccontextmanager
         async def _db_ctx(eng):
             yield mock_conn
@@ -566,13 +607,13 @@ class TestAdditionalNamesNotice:
         patches = (
             patch("wslcb_licensing_tracker.admin_auth._lookup_admin", return_value=None),
             patch("wslcb_licensing_tracker.app.get_db", side_effect=_db_ctx),
-            patch("wslcb_licensing_tracker.app.get_record_by_id", new=_get_record_by_id),
-            patch("wslcb_licensing_tracker.app.get_related_records", new=_get_related_records),
+            patch(
+                "wslcb_licensing_tracker.app.get_record_with_related",
+                new=_get_record_with_related,
+            ),
             patch("wslcb_licensing_tracker.app.hydrate_records", new=_hydrate_records),
             patch("wslcb_licensing_tracker.app.get_record_sources", new=_get_record_sources),
-            patch("wslcb_licensing_tracker.app.get_record_link", new=_get_record_link),
             patch("wslcb_licensing_tracker.app.get_reverse_link_info", new=_get_reverse_link_info),
-            patch("wslcb_licensing_tracker.app.get_outcome_status", new=_get_outcome_status),
         )
         for p in patches:
             p.start()
@@ -643,6 +684,89 @@ class TestExportCsvRoute:
         finally:
             _stop(patches)
 
+    def test_export_disables_proxy_buffering(self):
+        client, patches = _make_client()
+        try:
+            resp = client.get("/api/v1/export")
+            assert resp.headers["x-accel-buffering"] == "no"
+        finally:
+            _stop(patches)
+
+    def test_export_gzips_when_accepted(self):
+        """Clients accepting gzip get a compressed body that decodes to the CSV."""
+        client, patches = _make_client()
+        try:
+            resp = client.get("/api/v1/export", headers={"Accept-Encoding": "gzip"})
+            assert resp.headers["content-encoding"] == "gzip"
+            assert "section_type" in resp.text
+        finally:
+            _stop(patches)
+
+    def test_export_plain_without_gzip(self):
+        client, patches = _make_client()
+        try:
+            resp = client.get("/api/v1/export", headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in resp.headers
+            assert resp.text.startswith("section_type,")
+        finally:
+            _stop(patches)
+
+    def test_export_plain_when_gzip_refused(self):
+        """``gzip;q=0`` explicitly refuses gzip, so the body stays uncompressed."""
+        client, patches = _make_client()
+        try:
+            resp = client.get("/api/v1/export", headers={"Accept-Encoding": "gzip;q=0, identity"})
+            assert "content-encoding" not in resp.headers
+            assert resp.text.startswith("section_type,")
+        finally:
+            _stop(patches)
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip", True),
+            ("deflate, GZIP;q=0.5", True),
+            ("*", True),
+            ("gzip;q=0", False),
+            ("gzip; q=0.000", False),
+            ("x-gzip", False),
+            ("br, identity", False),
+            ("*;q=0", False),
+            ("gzip;q=0, *", False),
+            ("gzip;q=bogus", False),
+            ("", False),
+        ],
+    )
+    def test_accepts_gzip_parses_codings(self, header, expected):
+        from wslcb_licensing_tracker.api_routes import _accepts_gzip
+
+        assert _accepts_gzip(header) is expected
+
+    def test_export_flushes_every_row_across_chunks(self):
+        """Rows spanning several chunks are all written, including the partial tail."""
+        from wslcb_licensing_tracker.api_routes import _EXPORT_CHUNK_ROWS, _EXPORT_FIELDNAMES
+
+        total = _EXPORT_CHUNK_ROWS * 2 + 3
+        blank = dict.fromkeys(_EXPORT_FIELDNAMES)
+
+        async def _rows() -> AsyncGenerator[dict, None]:
+            for i in range(total):
+                yield {**blank, "section_type": "approved", "license_number": f"L{i}"}
+
+        client, patches = _make_client()
+        try:
+            with patch(
+                "wslcb_licensing_tracker.api_routes.export_records_cursor",
+                return_value=_rows(),
+            ):
+                resp = client.get("/api/v1/export")
+            lines = [l for l in resp.text.splitlines() if l.strip()]
+            assert len(lines) == total + 1
+            assert ",L0," in lines[1]
+            assert f",L{total - 1}," in lines[-1]
+        finally:
+            _stop(patches)
+
 
 class TestEntitiesRoute:
     """Tests for GET /entities landing page."""
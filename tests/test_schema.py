@@ -30,3 +30,38 @@ async def test_init_db_creates_tables(pg_engine):
     assert "locations" in tables
     assert "sources" in tables
     assert "record_sources" in tables
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_section_search_index_replaces_single_column_index(pg_engine):
+    """Section searches are served by the composite (section_type, record_date, id) index."""
+    async with pg_engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = 'license_records'")
+        )
+        indexes = {row[0] for row in result}
+
+    assert "idx_records_section_date" in indexes
+    assert "idx_records_section" not in indexes
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_address_key_lookup_uses_expression_index(pg_engine):
+    """The stored-result reuse lookup can be served by idx_locations_address_key."""
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    from wslcb_licensing_tracker.address_validator import _address_key_sql
+    from wslcb_licensing_tracker.models import locations
+
+    key = _address_key_sql()
+    stmt = select(locations.c.id).where(key.in_(["1 MAIN ST, SEATTLE, WA 98101"]))
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    async with pg_engine.connect() as conn:
+        # Tiny test tables favour a seq scan; rule it out so the plan shows
+        # whether the expression is indexable at all.
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in await conn.execute(text(f"EXPLAIN {sql}")))
+        await conn.rollback()
+
+    assert "idx_locations_address_key" in plan